@@ -166,7 +166,7 @@ def process_file(
     """
     # Validate inputs
     logger.info(f"Validating input file: {input_path}")
-    validate_file_readable(input_path)
+    input_stat = validate_file_readable(input_path)
     validate_text_encoding(input_path, encoding='utf-8')
     validate_file_writable(output_path)
 
@@ -174,11 +174,13 @@ def process_file(
         validate_file_writable(stats_path)
 
     # Determine if streaming should be used
-    file_size_bytes = input_path.stat().st_size
+    file_size_bytes = validate_file_size(input_path, stat_result=input_stat)
     file_size_mb = file_size_bytes / (1024 * 1024)
 
     if streaming is None:
-        use_streaming = should_use_streaming(input_path, streaming_threshold_mb)
+        use_streaming = should_use_streaming(
+            input_path, streaming_threshold_mb, file_size=file_size_bytes
+        )
     else:
         use_streaming = streaming
 
@@ -201,11 +203,17 @@ def process_file(
                 f"({progress['bytes_processed']:,} / {progress['file_size']:,} bytes)"
             )
 
-        result = processor.process_file_streaming(
-            input_path=input_path,
-            output_path=output_path,
-            progress_callback=progress_callback
-        )
+        # Encoding was only probed at the start of the file
+        try:
+            result = processor.process_file_streaming(
+                input_path=input_path,
+                output_path=output_path,
+                progress_callback=progress_callback,
+                file_size=file_size_bytes
+            )
+        except UnicodeDecodeError as e:
+            logger.error(f"Encoding error reading {input_path}: {e}")
+            raise ValidationError(f"File encoding error: {e}")
 
         # Write stats if requested
         if stats_path:
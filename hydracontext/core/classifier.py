@@ -6,10 +6,85 @@ prose, structured data, and mixed content.
 """
 
 import re
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+try:
+    import hyperscan
+except ImportError:  # Optional: multi-pattern scanning falls back to re
+    hyperscan = None
+
+
+_WORD_RE = re.compile(r'\b\w+\b')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+_XML_TAG_RE = re.compile(r'<[^>]+>')
+_KEY_VALUE_RE = re.compile(r'^\s*[\w-]+:\s+')
+
+# Character classes counted with str.count, one C-level pass per character
+_BRACKET_CHARS = '{}[]()<>'
+_WHITESPACE_CHARS = ' \t\n'
+
+
+@lru_cache(maxsize=None)
+def _compile_pattern_set(patterns: Tuple[str, ...], multiline: bool = False):
+    """
+    Compile patterns into a single Hyperscan database, if Hyperscan is available.
+
+    Databases are cached per pattern set, since compiling one is far more
+    expensive than constructing a classifier.
+
+    Args:
+        patterns: Regular expressions to match simultaneously
+        multiline: Whether ^ and $ match at line boundaries
+
+    Returns:
+        Hyperscan database, or None when patterns must be scanned with re
+    """
+    if hyperscan is None:
+        return None
+
+    flags = hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    if multiline:
+        flags |= hyperscan.HS_FLAG_MULTILINE
+
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[p.encode('utf-8') for p in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=flags
+        )
+    except hyperscan.HyperscanError:
+        return None
+    return database
+
+
+def _on_pattern_match(pattern_id, start, end, flags, matched) -> None:
+    """Hyperscan match callback: record which pattern matched."""
+    matched.add(pattern_id)
+
+
+def _count_matching_patterns(regexes, database, text: str) -> int:
+    """
+    Count how many patterns match somewhere in text.
+
+    Uses one Hyperscan pass over the text when a database is available,
+    otherwise searches each compiled regex in turn.
+    """
+    if database is not None:
+        try:
+            data = text.encode('utf-8')
+            matched = set()
+            database.scan(data, match_event_handler=_on_pattern_match, context=matched)
+            return len(matched)
+        except (UnicodeEncodeError, hyperscan.HyperscanError):
+            pass
+
+    return sum(1 for regex in regexes if regex.search(text))
+
 
 class ContentType(Enum):
     """Types of content."""
@@ -76,21 +151,67 @@ class ContentClassifier:
         r'^\s*[\w-]+:\s+',  # YAML-like key:value
     ]
 
-    def __init__(self, threshold: float = 0.6):
+    def __init__(self, threshold: float = 0.6, cache_size: int = 4096):
         """
         Initialize classifier.
 
         Args:
             threshold: Confidence threshold for classification (0.0 to 1.0)
+            cache_size: Number of recent classifications to memoize (0 disables)
         """
         self.threshold = threshold
+        self._cache_size = cache_size
+        self._code_regexes = [re.compile(p, re.MULTILINE) for p in self.CODE_PATTERNS]
+        self._prose_regexes = [re.compile(p) for p in self.PROSE_PATTERNS]
+        self._init_unpicklable()
+
+    def _init_unpicklable(self) -> None:
+        """Set up the Hyperscan databases and classification memo."""
+        self._code_database = _compile_pattern_set(tuple(self.CODE_PATTERNS), multiline=True)
+        # Hyperscan rejects \b in UCP mode, so the default prose set scans with re
+        self._prose_database = _compile_pattern_set(tuple(self.PROSE_PATTERNS))
+        self._classify_cached = lru_cache(maxsize=self._cache_size)(self._classify)
+
+    def __getstate__(self) -> Dict:
+        """Pickle without the Hyperscan databases and the memo."""
+        state = self.__dict__.copy()
+        for name in ('_code_database', '_prose_database', '_classify_cached'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore pickled state, rebuilding the databases and an empty memo."""
+        self.__dict__.update(state)
+        self._init_unpicklable()
 
     def classify(self, text: str) -> ClassificationResult:
         """
         Classify text as code, prose, structured data, or mixed.
 
+        Repeated texts are served from an in-memory cache; each call still
+        returns its own result object.
+
+        Args:
+            text: Text to classify
+
+        Returns:
+            ClassificationResult with type and confidence
+        """
+        result = self._classify_cached(text, self.threshold)
+        return ClassificationResult(
+            content_type=result.content_type,
+            confidence=result.confidence,
+            indicators=dict(result.indicators),
+            metadata=dict(result.metadata)
+        )
+
+    def _classify(self, text: str, threshold: float) -> ClassificationResult:
+        """
+        Classify text without consulting the cache.
+
         Args:
             text: Text to classify
+            threshold: Confidence threshold in effect for this call
 
         Returns:
             ClassificationResult with type and confidence
@@ -102,44 +223,40 @@ class ContentClassifier:
                 indicators={}
             )
 
-        # Calculate individual feature scores
-        indicators = {
-            'code_syntax': self._score_code_syntax(text),
-            'code_keywords': self._score_code_keywords(text),
-            'indentation': self._score_indentation(text),
-            'prose_patterns': self._score_prose_patterns(text),
-            'structured_data': self._score_structured_data(text),
-            'punctuation': self._score_punctuation(text),
-            'line_length': self._score_line_length(text),
-            'whitespace': self._score_whitespace(text),
-        }
+        # Calculate individual feature scores (lowercase once for the
+        # case-insensitive scorers)
+        text_lower = text.lower()
+        code_syntax = self._score_code_syntax(text)
+        code_keywords = self._score_code_keywords(text_lower)
+        indentation = self._score_indentation(text)
+        prose_patterns = self._score_prose_patterns(text_lower)
+        structured_score = self._score_structured_data(text)
+        punctuation = self._score_punctuation(text)
 
         # Weighted combination
         code_score = (
-            indicators['code_syntax'] * 0.3 +
-            indicators['code_keywords'] * 0.25 +
-            indicators['indentation'] * 0.2 +
-            (1 - indicators['prose_patterns']) * 0.25
+            code_syntax * 0.3 +
+            code_keywords * 0.25 +
+            indentation * 0.2 +
+            (1 - prose_patterns) * 0.25
         )
 
         prose_score = (
-            indicators['prose_patterns'] * 0.4 +
-            indicators['punctuation'] * 0.3 +
-            (1 - indicators['code_syntax']) * 0.3
+            prose_patterns * 0.4 +
+            punctuation * 0.3 +
+            (1 - code_syntax) * 0.3
         )
 
-        structured_score = indicators['structured_data']
-
         # Determine classification
         max_score = max(code_score, prose_score, structured_score)
 
         if structured_score > 0.7:
             content_type = ContentType.STRUCTURED_DATA
             confidence = structured_score
-        elif code_score > prose_score and code_score >= self.threshold:
+        elif code_score > prose_score and code_score >= threshold:
             content_type = ContentType.CODE
             confidence = code_score
-        elif prose_score >= self.threshold:
+        elif prose_score >= threshold:
             content_type = ContentType.PROSE
             confidence = prose_score
         elif abs(code_score - prose_score) < 0.2:
@@ -159,6 +276,17 @@ class ContentClassifier:
             'line_count': len(text.splitlines()),
         }
 
+        indicators = {
+            'code_syntax': code_syntax,
+            'code_keywords': code_keywords,
+            'indentation': indentation,
+            'prose_patterns': prose_patterns,
+            'structured_data': structured_score,
+            'punctuation': punctuation,
+            'line_length': self._score_line_length(text),
+            'whitespace': self._score_whitespace(text),
+        }
+
         return ClassificationResult(
             content_type=content_type,
             confidence=confidence,
@@ -166,6 +294,19 @@ class ContentClassifier:
             metadata=metadata
         )
 
+    def classify_batch(self, texts: List[str]) -> List[ClassificationResult]:
+        """
+        Classify several texts in one call.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            ClassificationResult for each text, in input order
+        """
+        classify = self.classify
+        return [classify(text) for text in texts]
+
     def _score_code_syntax(self, text: str) -> float:
         """
         Score based on code syntax patterns.
@@ -173,15 +314,11 @@ class ContentClassifier:
         Returns:
             Score from 0.0 (no code syntax) to 1.0 (heavy code syntax)
         """
-        total_patterns = len(self.CODE_PATTERNS)
-        matches = 0
-
-        for pattern in self.CODE_PATTERNS:
-            if re.search(pattern, text, re.MULTILINE):
-                matches += 1
+        total_patterns = len(self._code_regexes)
+        matches = _count_matching_patterns(self._code_regexes, self._code_database, text)
 
         # Also check bracket density
-        bracket_chars = sum(1 for c in text if c in '{}[]()<>')
+        bracket_chars = sum(map(text.count, _BRACKET_CHARS))
         bracket_density = bracket_chars / len(text) if text else 0
 
         pattern_score = matches / total_patterns
@@ -189,14 +326,17 @@ class ContentClassifier:
 
         return min(syntax_score, 1.0)
 
-    def _score_code_keywords(self, text: str) -> float:
+    def _score_code_keywords(self, text_lower: str) -> float:
         """
         Score based on programming keywords.
 
+        Args:
+            text_lower: Lowercased text
+
         Returns:
             Score from 0.0 to 1.0
         """
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_RE.findall(text_lower)
 
         if not words:
             return 0.0
@@ -240,25 +380,25 @@ class ContentClassifier:
 
         return min(indentation_ratio + consistency_bonus, 1.0)
 
-    def _score_prose_patterns(self, text: str) -> float:
+    def _score_prose_patterns(self, text_lower: str) -> float:
         """
         Score based on natural language patterns.
 
+        Args:
+            text_lower: Lowercased text (case does not affect sentence counts)
+
         Returns:
             Score from 0.0 to 1.0
         """
-        text_lower = text.lower()
-        total_patterns = len(self.PROSE_PATTERNS)
-        matches = 0
-
-        for pattern in self.PROSE_PATTERNS:
-            if re.search(pattern, text_lower):
-                matches += 1
+        total_patterns = len(self._prose_regexes)
+        matches = _count_matching_patterns(
+            self._prose_regexes, self._prose_database, text_lower
+        )
 
         pattern_score = matches / total_patterns
 
         # Check for sentence-like structure
-        sentences = re.split(r'[.!?]+', text)
+        sentences = _SENTENCE_SPLIT_RE.split(text_lower)
         avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences) if sentences else 0
 
         # Prose typically has 10-25 words per sentence
@@ -291,7 +431,7 @@ class ContentClassifier:
 
         # XML detection
         if stripped.startswith('<') and stripped.endswith('>'):
-            tag_count = len(re.findall(r'<[^>]+>', stripped))
+            tag_count = len(_XML_TAG_RE.findall(stripped))
             if tag_count >= 2:
                 return 0.9
 
@@ -299,7 +439,7 @@ class ContentClassifier:
         lines = stripped.splitlines()
         key_value_lines = sum(
             1 for line in lines
-            if re.match(r'^\s*[\w-]+:\s+', line)
+            if _KEY_VALUE_RE.match(line)
         )
 
         if lines and key_value_lines / len(lines) > 0.5:
@@ -374,7 +514,7 @@ class ContentClassifier:
             return 0.0
 
         # Code typically has more whitespace
-        whitespace_ratio = sum(1 for c in text if c in ' \t\n') / len(text)
+        whitespace_ratio = sum(map(text.count, _WHITESPACE_CHARS)) / len(text)
 
         # Code also has more blank lines
         lines = text.splitlines()
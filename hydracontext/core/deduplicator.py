@@ -6,14 +6,64 @@ and optional persistent caching for large-scale processing.
 """
 
 import hashlib
-import json
+import sys
 from pathlib import Path
-from typing import Set, Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Set, Any
+from dataclasses import dataclass
+from concurrent.futures import Executor
+from functools import lru_cache
+from itertools import chain
 from datetime import datetime
 
+from ..utils.output import WRITE_BUFFER_SIZE, decode_json, encode_jsonl_line
 
-@dataclass
+try:
+    import blake3
+except ImportError:  # Optional: enables the 'blake3' algorithm
+    blake3 = None
+
+try:
+    import xxhash
+except ImportError:  # Optional: enables the 'xxh3' algorithm
+    xxhash = None
+
+# Hash constructors by algorithm name, resolved once per deduplicator
+_HASH_CONSTRUCTORS = {
+    'md5': hashlib.md5,
+    'sha256': hashlib.sha256,
+    'blake2b': hashlib.blake2b,
+}
+if blake3 is not None:
+    _HASH_CONSTRUCTORS['blake3'] = blake3.blake3
+if xxhash is not None:
+    # Non-cryptographic, 128-bit: fine for dedup, not for untrusted input
+    _HASH_CONSTRUCTORS['xxh3'] = xxhash.xxh3_128
+
+# Algorithm names accepted by ContentDeduplicator in this environment
+SUPPORTED_ALGORITHMS = frozenset(_HASH_CONSTRUCTORS)
+
+# Bytes of each digest kept as the in-memory key; 128 bits is far beyond
+# any practical deduplication scale and halves sha256/blake2b key size
+_DIGEST_KEY_SIZE = 16
+
+# Texts per task when deduplicate_list hashes on an executor
+_HASH_SLICE_SIZE = 1024
+
+# Caches hold one record per unique segment, so drop the per-instance
+# __dict__ where dataclasses support it (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Substrings that mark text as code-like during normalization
+_CODE_INDICATORS = (
+    '{', '}', '()', '=>', 'function', 'class',
+    'def ', 'import ', 'const ', 'let ', 'var ',
+)
+
+# Punctuation stripped from the ends of normalized prose
+_STRIP_CHARS = '.,;:!? \t\n'
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ContentHash:
     """Metadata for a hashed content segment."""
     hash: str
@@ -24,7 +74,14 @@ class ContentHash:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        # Built field by field; asdict() deep-copies every value recursively
+        return {
+            'hash': self.hash,
+            'text': self.text,
+            'first_seen': self.first_seen,
+            'occurrences': self.occurrences,
+            'metadata': dict(self.metadata) if self.metadata is not None else None,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'ContentHash':
@@ -48,25 +105,44 @@ class ContentDeduplicator:
         algorithm: str = 'sha256',
         normalize: bool = True,
         cache_path: Optional[Path] = None,
-        min_length: int = 10
+        min_length: int = 10,
+        digest_cache_size: int = 4096,
+        full_digests: bool = False
     ):
         """
         Initialize the deduplicator.
 
         Args:
-            algorithm: Hash algorithm ('md5', 'sha256', 'blake2b')
+            algorithm: Hash algorithm ('md5', 'sha256', 'blake2b'; 'blake3' and
+                'xxh3' when the blake3 / xxhash packages are installed)
             normalize: Whether to normalize text before hashing
             cache_path: Path to persistent cache file (JSONL)
             min_length: Minimum text length to process
+            digest_cache_size: Number of recent text digests to memoize (0 disables)
+            full_digests: Keep the algorithm's full digest instead of truncating
+                keys to 16 bytes
+
+        Raises:
+            ValueError: If the hash algorithm is not supported, or the cache
+                holds digests shorter than this instance's keys
         """
+        if algorithm not in _HASH_CONSTRUCTORS:
+            raise ValueError(f"Unsupported algorithm: {algorithm}")
+
         self.algorithm = algorithm
+        self._hash_constructor = _HASH_CONSTRUCTORS[algorithm]
         self.normalize = normalize
         self.cache_path = Path(cache_path) if cache_path else None
         self.min_length = min_length
+        self._key_size = None if full_digests else _DIGEST_KEY_SIZE
+        self._key_length = len(self._hash_constructor(b'').digest()[:self._key_size])
+
+        # Repeated texts skip normalization, encoding and hashing
+        self._digest_cache_size = digest_cache_size
+        self._digest = lru_cache(maxsize=digest_cache_size)(self._compute_digest)
 
-        # In-memory hash storage
-        self.hash_map: Dict[str, ContentHash] = {}
-        self.seen_hashes: Set[str] = set()
+        # In-memory hash storage, keyed by raw digest bytes
+        self.hash_map: Dict[bytes, ContentHash] = {}
 
         # Statistics
         self.stats = {
@@ -80,6 +156,28 @@ class ContentDeduplicator:
         if self.cache_path and self.cache_path.exists():
             self._load_cache()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the digest memo, which wraps a bound method."""
+        state = self.__dict__.copy()
+        del state['_digest']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore pickled state with an empty digest memo."""
+        self.__dict__.update(state)
+        self._digest = lru_cache(maxsize=self._digest_cache_size)(self._compute_digest)
+
+    @property
+    def seen_hashes(self) -> Set[str]:
+        """
+        Hex digests recorded so far, in the form returned by hash_text.
+
+        Built from the hash map on each access, so it is a snapshot: adding
+        to it does not record anything. Use is_duplicate(text, record=False)
+        for repeated membership checks.
+        """
+        return {digest.hex() for digest in self.hash_map}
+
     def hash_text(self, text: str) -> str:
         """
         Generate hash for text content.
@@ -88,20 +186,26 @@ class ContentDeduplicator:
             text: Text to hash
 
         Returns:
-            Hex digest of hash
+            Hex digest of hash (first 16 bytes unless full_digests is set)
+        """
+        return self._digest(text).hex()
+
+    def _compute_digest(self, text: str) -> bytes:
+        """
+        Generate the raw digest used as the in-memory lookup key.
+
+        Called through the memoized ``self._digest``.
+
+        Args:
+            text: Text to hash
+
+        Returns:
+            Digest bytes
         """
         # Normalize if requested
         content = self._normalize_text(text) if self.normalize else text
 
-        # Generate hash based on algorithm
-        if self.algorithm == 'md5':
-            return hashlib.md5(content.encode('utf-8')).hexdigest()
-        elif self.algorithm == 'sha256':
-            return hashlib.sha256(content.encode('utf-8')).hexdigest()
-        elif self.algorithm == 'blake2b':
-            return hashlib.blake2b(content.encode('utf-8')).hexdigest()
-        else:
-            raise ValueError(f"Unsupported algorithm: {self.algorithm}")
+        return self._hash_constructor(content.encode('utf-8')).digest()[:self._key_size]
 
     def is_duplicate(self, text: str, record: bool = True) -> bool:
         """
@@ -114,64 +218,146 @@ class ContentDeduplicator:
         Returns:
             True if duplicate, False if unique
         """
+        if record:
+            return not self.add_if_new(text)
+
         if len(text) < self.min_length:
             return False
 
-        content_hash = self.hash_text(text)
+        digest = self._digest(text)
         self.stats['total_processed'] += 1
 
-        is_dup = content_hash in self.seen_hashes
+        return digest in self.hash_map
 
-        if record:
-            if is_dup:
-                # Update occurrence count
-                self.hash_map[content_hash].occurrences += 1
-                self.stats['duplicates_found'] += 1
-                if self.cache_path:
-                    self.stats['cache_hits'] += 1
-            else:
-                # New unique content
-                self.seen_hashes.add(content_hash)
-                self.hash_map[content_hash] = ContentHash(
-                    hash=content_hash,
-                    text=text[:200] + '...' if len(text) > 200 else text,  # Store preview
-                    first_seen=datetime.utcnow().isoformat(),
-                    occurrences=1
-                )
-                self.stats['unique_content'] += 1
+    def add_if_new(self, text: str) -> bool:
+        """
+        Record text and report whether it had not been seen before.
+
+        Equivalent to ``not is_duplicate(text, record=True)``.
+
+        Args:
+            text: Text to record
+
+        Returns:
+            True if the text is new (or too short to track), False if duplicate
+        """
+        if len(text) < self.min_length:
+            return True
+
+        return self._record_digest(text, self._digest(text))
+
+    def _record_digest(self, text: str, digest: bytes) -> bool:
+        """
+        Record an already-hashed text.
+
+        Args:
+            text: Text the digest was computed from
+            digest: Digest from _digest(text)
+
+        Returns:
+            True if the digest is new, False if duplicate
+        """
+        self.stats['total_processed'] += 1
+
+        # One probe decides new vs. duplicate
+        existing = self.hash_map.get(digest)
+
+        if existing is not None:
+            # Update occurrence count
+            existing.occurrences += 1
+            self.stats['duplicates_found'] += 1
+            if self.cache_path:
+                self.stats['cache_hits'] += 1
+            return False
+
+        # New unique content
+        self.hash_map[digest] = ContentHash(
+            hash=digest.hex(),
+            text=text[:200] + '...' if len(text) > 200 else text,  # Store preview
+            first_seen=datetime.utcnow().isoformat(),
+            occurrences=1
+        )
+        self.stats['unique_content'] += 1
+        return True
+
+    def bulk_filter(self, texts: Iterable[str]) -> List[str]:
+        """
+        Record many texts and return the ones not seen before.
+
+        Equivalent to ``[t for t in texts if self.add_if_new(t)]``, with the
+        method lookups hoisted out of the loop.
+
+        Args:
+            texts: Texts to record
 
-        return is_dup
+        Returns:
+            Texts that were new (or too short to track), in input order
+        """
+        min_length = self.min_length
+        digest_of = self._digest
+        record = self._record_digest
 
-    def deduplicate_list(self, texts: List[str]) -> List[str]:
+        return [
+            text for text in texts
+            if len(text) < min_length or record(text, digest_of(text))
+        ]
+
+    def deduplicate_list(self, texts: List[str], executor: Optional[Executor] = None) -> List[str]:
         """
         Remove duplicates from a list of texts.
 
         Args:
             texts: List of text strings
+            executor: Optional executor to hash slices of the list concurrently.
+                Hashing releases the GIL only for inputs over ~2 KiB, so this
+                helps with long texts; recording always runs on the caller.
+                Process pools also work, but pickle the deduplicator per task.
 
         Returns:
             List with duplicates removed (preserves order)
         """
+        if executor is not None and len(texts) > _HASH_SLICE_SIZE:
+            slices = [
+                texts[i:i + _HASH_SLICE_SIZE]
+                for i in range(0, len(texts), _HASH_SLICE_SIZE)
+            ]
+            digests = chain.from_iterable(executor.map(self._hash_batch, slices))
+        else:
+            digests = self._hash_batch(texts)
+
         unique_texts = []
         seen_in_batch = set()
+        record = self._record_digest
 
-        for text in texts:
-            if len(text) < self.min_length:
+        for text, digest in zip(texts, digests):
+            if digest is None:
                 unique_texts.append(text)
                 continue
 
-            text_hash = self.hash_text(text)
-
             # Check both global cache and current batch
-            if text_hash not in seen_in_batch:
+            if digest not in seen_in_batch:
                 unique_texts.append(text)
-                seen_in_batch.add(text_hash)
+                seen_in_batch.add(digest)
 
                 # Update global tracking
-                self.is_duplicate(text, record=True)
+                record(text, digest)
 
         return unique_texts
 
+    def _hash_batch(self, texts: List[str]) -> List[Optional[bytes]]:
+        """
+        Digest a batch of texts in one pass.
+
+        Args:
+            texts: Texts to hash
+
+        Returns:
+            Digest for each text, or None where the text is below min_length
+        """
+        min_length = self.min_length
+        digest = self._digest
+        return [digest(text) if len(text) >= min_length else None for text in texts]
+
     def get_hash_info(self, text: str) -> Optional[ContentHash]:
         """
         Get hash information for a text.
@@ -182,8 +368,7 @@ class ContentDeduplicator:
         Returns:
             ContentHash object if found, None otherwise
         """
-        text_hash = self.hash_text(text)
-        return self.hash_map.get(text_hash)
+        return self.hash_map.get(self._digest(text))
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -194,7 +379,7 @@ class ContentDeduplicator:
         """
         return {
             **self.stats,
-            'unique_hashes': len(self.seen_hashes),
+            'unique_hashes': len(self.hash_map),
             'dedup_ratio': (
                 self.stats['duplicates_found'] / self.stats['total_processed']
                 if self.stats['total_processed'] > 0 else 0
@@ -217,26 +402,45 @@ class ContentDeduplicator:
         save_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write JSONL format
-        with open(save_path, 'w', encoding='utf-8') as f:
-            for content_hash in self.hash_map.values():
-                json.dump(content_hash.to_dict(), f)
-                f.write('\n')
+        with open(save_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(
+                encode_jsonl_line(content_hash.to_dict())
+                for content_hash in self.hash_map.values()
+            )
 
     def _load_cache(self) -> None:
-        """Load hash cache from disk."""
+        """
+        Load hash cache from disk.
+
+        Longer stored digests (e.g. from a full_digests cache) are truncated
+        to this instance's key length, and their records rewritten to match.
+
+        Raises:
+            ValueError: If a stored digest is shorter than the key length
+        """
         if not self.cache_path or not self.cache_path.exists():
             return
 
-        with open(self.cache_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    data = json.loads(line)
-                    content_hash = ContentHash.from_dict(data)
-                    self.hash_map[content_hash.hash] = content_hash
-                    self.seen_hashes.add(content_hash.hash)
+        # One read and one split instead of a readline call per record
+        hash_map = self.hash_map
+        key_length = self._key_length
+        for line in self.cache_path.read_bytes().splitlines():
+            if line.strip():
+                content_hash = ContentHash.from_dict(decode_json(line))
+                stored = bytes.fromhex(content_hash.hash)
+                if len(stored) < key_length:
+                    raise ValueError(
+                        f"Cache {self.cache_path} holds {len(stored)}-byte digests, "
+                        f"shorter than the {key_length}-byte keys in use; "
+                        "load it without full_digests"
+                    )
+                if len(stored) > key_length:
+                    stored = stored[:key_length]
+                    content_hash.hash = stored.hex()
+                hash_map[stored] = content_hash
 
         # Update stats
-        self.stats['unique_content'] = len(self.seen_hashes)
+        self.stats['unique_content'] = len(self.hash_map)
 
     def _normalize_text(self, text: str) -> str:
         """
@@ -248,45 +452,46 @@ class ContentDeduplicator:
         Returns:
             Normalized text
         """
-        # Convert to lowercase
-        normalized = text.lower()
-
-        # Collapse whitespace
-        normalized = ' '.join(normalized.split())
+        # Convert to lowercase and collapse whitespace
+        normalized = ' '.join(text.lower().split())
 
         # Remove common punctuation variations
-        # (but preserve structure for code)
-        if not self._looks_like_code(normalized):
-            # More aggressive normalization for prose
-            normalized = normalized.strip('.,;:!? \t\n')
+        # (but preserve structure for code). Stripping can only change text
+        # that starts or ends with punctuation, so skip the code check otherwise.
+        if normalized and (normalized[0] in _STRIP_CHARS or normalized[-1] in _STRIP_CHARS):
+            if not self._looks_like_code(normalized, lowered=True):
+                # More aggressive normalization for prose
+                normalized = normalized.strip(_STRIP_CHARS)
 
         return normalized
 
-    def _looks_like_code(self, text: str) -> bool:
+    def _looks_like_code(self, text: str, lowered: bool = False) -> bool:
         """
         Quick heuristic to detect code-like content.
 
         Args:
             text: Text to check
+            lowered: Whether text is already lowercase
 
         Returns:
             True if text looks like code
         """
-        # Simple heuristics
-        code_indicators = [
-            '{', '}', '()', '=>', 'function', 'class',
-            'def ', 'import ', 'const ', 'let ', 'var ',
-        ]
+        text_lower = text if lowered else text.lower()
 
-        text_lower = text.lower()
-        matches = sum(1 for indicator in code_indicators if indicator in text_lower)
+        # Simple heuristics: two indicators are enough
+        matches = 0
+        for indicator in _CODE_INDICATORS:
+            if indicator in text_lower:
+                matches += 1
+                if matches >= 2:
+                    return True
 
-        return matches >= 2
+        return False
 
     def clear_cache(self) -> None:
         """Clear in-memory cache and reset statistics."""
         self.hash_map.clear()
-        self.seen_hashes.clear()
+        self._digest.cache_clear()
         self.stats = {
             'total_processed': 0,
             'unique_content': 0,
@@ -309,17 +514,11 @@ class ContentDeduplicator:
         elif format == 'csv':
             import csv
             with open(output_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=['hash', 'text', 'first_seen', 'occurrences']
+                writer = csv.writer(f)
+                writer.writerow(['hash', 'text', 'first_seen', 'occurrences'])
+                writer.writerows(
+                    (h.hash, h.text, h.first_seen, h.occurrences)
+                    for h in self.hash_map.values()
                 )
-                writer.writeheader()
-                for content_hash in self.hash_map.values():
-                    writer.writerow({
-                        'hash': content_hash.hash,
-                        'text': content_hash.text,
-                        'first_seen': content_hash.first_seen,
-                        'occurrences': content_hash.occurrences,
-                    })
         else:
             raise ValueError(f"Unsupported format: {format}")
@@ -247,7 +247,8 @@ class PromptProcessor:
             self.seen_hashes
         )
 
-        # Step 5: Enrich with metadata
+        # Step 5: Enrich with metadata (one timestamp per prompt)
+        timestamp = datetime.utcnow().isoformat()
         enriched_segments = []
         for i, segment in enumerate(processed_segments):
             enriched = {
@@ -261,7 +262,7 @@ class PromptProcessor:
                 "hash": segment["hash"],
                 "duplicate": segment.get("duplicate", False),
                 "token_estimate": count_tokens_estimate(segment["content"]),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp
             }
 
             # Extract code blocks if present
@@ -286,15 +287,14 @@ class PromptProcessor:
         Returns:
             List of processed segment lists
         """
+        process = self.process
         results = []
 
         for item in prompts:
             if isinstance(item, str):
-                segments = self.process(item)
+                segments = process(item)
             else:
-                prompt_id = item.get("id")
-                content = item.get("content", "")
-                segments = self.process(content, prompt_id)
+                segments = process(item.get("content", ""), item.get("id"))
 
             results.append(segments)
 
@@ -11,6 +11,23 @@ from dataclasses import dataclass
 from enum import Enum
 
 
+# First non-whitespace character (\s matches exactly what str.isspace does)
+_NON_SPACE_RE = re.compile(r'\S')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+_HEADING_RE = re.compile(r'^#{1,6}\s+')
+_BULLET_ITEM_RE = re.compile(r'^[\-\*\+]\s+')
+_NUMBERED_ITEM_RE = re.compile(r'^\d+\.\s+')
+
+# Literals of which every match of a code block pattern contains at least
+# one. Text without any of them is skipped with substring checks instead of
+# a regex scan.
+_REQUIRED_LITERALS = {
+    r'```[\s\S]*?```': ('```',),
+    r'~~~[\s\S]*?~~~': ('~~~',),
+    r'(?:^|\n)(?: {4}|\t).+(?:\n(?: {4}|\t).+)*': ('    ', '\t'),
+}
+
+
 class SegmentType(Enum):
     """Types of text segments."""
     SENTENCE = "sentence"
@@ -72,6 +89,13 @@ class ContextSegmenter:
         """
         self.min_sentence_length = min_sentence_length
         self.preserve_code = preserve_code
+        # str.endswith accepts a tuple and checks every suffix in one call
+        self._abbreviation_suffixes = tuple(self.ABBREVIATIONS)
+        self._sentence_ender_re = re.compile(self.SENTENCE_ENDERS)
+        self._code_block_regexes = [
+            (re.compile(pattern, re.MULTILINE), code_type, _REQUIRED_LITERALS.get(pattern))
+            for pattern, code_type in self.CODE_BLOCK_PATTERNS
+        ]
 
     def segment_text(self, text: str, granularity: str = 'sentence') -> List[Segment]:
         """
@@ -150,30 +174,24 @@ class ContextSegmenter:
         """
         segments = []
 
-        # Split on double newlines (paragraph breaks)
-        paragraphs = re.split(r'\n\s*\n', text)
-
-        current_pos = 0
-        for para in paragraphs:
-            if not para.strip():
-                current_pos += len(para) + 2  # Account for newlines
-                continue
-
-            # Determine paragraph type
-            para_type = self._classify_paragraph(para)
-
-            # Find actual position in original text
-            start_pos = text.find(para, current_pos)
-            end_pos = start_pos + len(para)
-
-            segments.append(Segment(
-                text=para,
-                type=para_type,
-                start_pos=start_pos,
-                end_pos=end_pos
-            ))
+        # Paragraphs are the spans between double newlines (paragraph
+        # breaks); the break matches give their positions directly
+        start_pos = 0
+        breaks = [(m.start(), m.end()) for m in _PARAGRAPH_BREAK_RE.finditer(text)]
+        breaks.append((len(text), len(text)))
+
+        for end_pos, next_start in breaks:
+            para = text[start_pos:end_pos]
+
+            if para.strip():
+                segments.append(Segment(
+                    text=para,
+                    type=self._classify_paragraph(para),
+                    start_pos=start_pos,
+                    end_pos=end_pos
+                ))
 
-            current_pos = end_pos
+            start_pos = next_start
 
         return segments
 
@@ -186,8 +204,10 @@ class ContextSegmenter:
         """
         code_blocks = []
 
-        for pattern, code_type in self.CODE_BLOCK_PATTERNS:
-            for match in re.finditer(pattern, text, re.MULTILINE):
+        for regex, code_type, literals in self._code_block_regexes:
+            if literals and not any(literal in text for literal in literals):
+                continue
+            for match in regex.finditer(text):
                 code_blocks.append((match.start(), match.end(), code_type))
 
         # Sort by position and merge overlapping blocks
@@ -216,10 +236,8 @@ class ContextSegmenter:
         sentences = []
 
         # Simple sentence splitting with abbreviation awareness
-        potential_breaks = list(re.finditer(self.SENTENCE_ENDERS, text))
-
         sentence_start = 0
-        for i, match in enumerate(potential_breaks):
+        for match in self._sentence_ender_re.finditer(text):
             end_pos = match.end()
 
             # Check if this is a real sentence boundary
@@ -265,9 +283,8 @@ class ContextSegmenter:
         if punct_pos > 0:
             # Look back for potential abbreviation
             before = text[max(0, punct_pos - 10):punct_pos].lower()
-            for abbrev in self.ABBREVIATIONS:
-                if before.endswith(abbrev):
-                    return False
+            if before.endswith(self._abbreviation_suffixes):
+                return False
 
         # Check what comes after
         if end_pos < len(text):
@@ -278,10 +295,12 @@ class ContextSegmenter:
 
             # Next character should be uppercase or digit (for numbered lists)
             if end_pos + 1 < len(text):
-                next_char = text[end_pos:].lstrip()[:1]
-                if next_char and not (next_char[0].isupper() or next_char[0].isdigit()):
+                # Scan forward instead of copying and stripping the rest of the text
+                next_match = _NON_SPACE_RE.search(text, end_pos)
+                next_char = next_match.group() if next_match else ''
+                if next_char and not (next_char.isupper() or next_char.isdigit()):
                     # Exception for quotes
-                    if next_char[0] not in '"\'':
+                    if next_char not in '"\'':
                         return False
 
         return True
@@ -299,11 +318,11 @@ class ContextSegmenter:
         stripped = para.strip()
 
         # Check for heading (markdown style)
-        if re.match(r'^#{1,6}\s+', stripped):
+        if _HEADING_RE.match(stripped):
             return SegmentType.HEADING
 
         # Check for list item
-        if re.match(r'^[\-\*\+]\s+', stripped) or re.match(r'^\d+\.\s+', stripped):
+        if _BULLET_ITEM_RE.match(stripped) or _NUMBERED_ITEM_RE.match(stripped):
             return SegmentType.LIST_ITEM
 
         # Check for code block
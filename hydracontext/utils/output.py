@@ -5,10 +5,122 @@ Handles JSONL export, statistics generation, and reporting.
 """
 
 import json
+import math
+import re
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used instead
+    orjson = None
+
+# Types orjson would serialize but the stdlib rejects; passing them through
+# makes orjson raise so both backends fail alike
+_ORJSON_PASSTHROUGH = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None else 0
+)
+
+# Buffer size for JSONL writers; large enough that many-line outputs reach
+# the OS in a few big writes instead of one per default-sized block
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Line boundaries str.splitlines() recognizes besides '\n'
+_OTHER_LINE_BREAKS_RE = re.compile('[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Check whether a JSON-like value contains NaN or an infinity."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(map(_has_non_finite, value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(map(_has_non_finite, value))
+    return False
+
+
+def _orjson_dumps(item: Any, option: int) -> Optional[bytes]:
+    """
+    Serialize with orjson, or return None when the stdlib must be used.
+
+    orjson writes NaN and infinities as null where the stdlib writes NaN /
+    Infinity, so values containing them go to the stdlib. Only output that
+    contains a null is searched for them. Datetimes and dataclasses are
+    passed through so they fail as they do with the stdlib.
+    """
+    if orjson is None:
+        return None
+    try:
+        data = orjson.dumps(item, option=option | _ORJSON_PASSTHROUGH)
+    except TypeError:
+        return None
+    if b'null' in data and _has_non_finite(item):
+        return None
+    return data
+
+
+def encode_jsonl_line(item: Any) -> bytes:
+    """
+    Encode one record as a compact UTF-8 JSON line.
+
+    Uses orjson when installed, falling back to the stdlib for values it
+    rejects (non-string keys, integers beyond 64 bits) or would change
+    (NaN and infinities); datetimes and dataclasses raise TypeError with
+    either backend. Differences that remain with orjson: Enum members and
+    UUIDs are serialized (by value / as strings) instead of raising, and
+    float exponents are spelled without '+' (1e16 vs 1e+16).
+
+    Args:
+        item: JSON-serializable value
+
+    Returns:
+        Encoded line, including the trailing newline
+    """
+    data = _orjson_dumps(item, orjson.OPT_APPEND_NEWLINE) if orjson is not None else None
+    if data is not None:
+        return data
+
+    line = json.dumps(item, ensure_ascii=False, separators=(',', ':'))
+    return (line + '\n').encode('utf-8')
+
+
+def decode_json(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document, using orjson when installed.
+
+    Args:
+        data: UTF-8 bytes or text
+
+    Returns:
+        Decoded value
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Let the stdlib accept what it can (e.g. NaN) or raise
+
+    return json.loads(data)
+
+
+def _count_lines(text: str) -> int:
+    """
+    Count lines as ``len(text.splitlines())`` does, without building the list.
+
+    Args:
+        text: Text to count
+
+    Returns:
+        Number of lines
+    """
+    if _OTHER_LINE_BREAKS_RE.search(text):
+        return len(text.splitlines())
+
+    return text.count('\n') + (1 if text and not text.endswith('\n') else 0)
+
 
 class OutputWriter:
     """
@@ -33,12 +145,10 @@ class OutputWriter:
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        mode = 'a' if append else 'w'
+        mode = 'ab' if append else 'wb'
 
-        with open(output_path, mode, encoding='utf-8') as f:
-            for item in data:
-                json.dump(item, f, ensure_ascii=False)
-                f.write('\n')
+        with open(output_path, mode, buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(map(encode_jsonl_line, data))
 
     @staticmethod
     def read_jsonl(input_path: Path) -> List[Dict[str, Any]]:
@@ -53,10 +163,10 @@ class OutputWriter:
         """
         data = []
 
-        with open(input_path, 'r', encoding='utf-8') as f:
+        with open(input_path, 'rb') as f:
             for line in f:
                 if line.strip():
-                    data.append(json.loads(line))
+                    data.append(decode_json(line))
 
         return data
 
@@ -77,6 +187,11 @@ class OutputWriter:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         if format == 'json':
+            data = _orjson_dumps(stats, orjson.OPT_INDENT_2) if orjson is not None else None
+            if data is not None:
+                output_path.write_bytes(data)
+                return
+
             with open(output_path, 'w', encoding='utf-8') as f:
                 json.dump(stats, f, indent=2, ensure_ascii=False)
 
@@ -167,7 +282,7 @@ class StatsCollector:
             text: Input text
         """
         self.stats['input']['total_characters'] += len(text)
-        self.stats['input']['total_lines'] += len(text.splitlines())
+        self.stats['input']['total_lines'] += _count_lines(text)
         self.stats['input']['files_processed'] += 1
 
     def update_segment_stats(self, segment_type: str) -> None:
@@ -4,14 +4,20 @@ Streaming utilities for processing large files.
 Provides memory-efficient file processing by reading and processing in chunks.
 """
 
+from contextlib import closing
 from pathlib import Path
-from typing import Iterator, Optional, Callable, Dict, Any
-import json
+from typing import Iterator, List, Optional, Callable, Dict, Any
+import codecs
+import io
+import mmap
+import queue
+import threading
 
 from hydracontext.core.segmenter import ContextSegmenter, Segment
 from hydracontext.core.deduplicator import ContentDeduplicator
 from hydracontext.core.classifier import ContentClassifier
 from hydracontext.utils.logging import get_logger
+from hydracontext.utils.output import WRITE_BUFFER_SIZE, encode_jsonl_line
 
 logger = get_logger(__name__)
 
@@ -31,7 +37,9 @@ class StreamingProcessor:
         granularity: str = 'sentence',
         classify: bool = True,
         deduplicate: bool = True,
-        cache_path: Optional[Path] = None
+        cache_path: Optional[Path] = None,
+        read_ahead: int = 4,
+        mmap_threshold: int = 16 * 1024 * 1024
     ):
         """
         Initialize streaming processor.
@@ -43,10 +51,16 @@ class StreamingProcessor:
             classify: Whether to classify content
             deduplicate: Whether to deduplicate
             cache_path: Path to deduplication cache
+            read_ahead: Chunks a background thread may read ahead of processing
+                (0 reads inline)
+            mmap_threshold: Files of at least this many bytes are memory-mapped
+                instead of read through a buffered handle (0 never maps)
         """
         self.chunk_size = chunk_size
         self.overlap_size = overlap_size
         self.granularity = granularity
+        self.read_ahead = read_ahead
+        self.mmap_threshold = mmap_threshold
 
         # Initialize components
         self.segmenter = ContextSegmenter()
@@ -66,7 +80,8 @@ class StreamingProcessor:
         self,
         input_path: Path,
         output_path: Path,
-        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        file_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Process a file in streaming mode.
@@ -75,23 +90,26 @@ class StreamingProcessor:
             input_path: Path to input file
             output_path: Path to output JSONL file
             progress_callback: Optional callback for progress updates
+            file_size: Input size in bytes if already known; stat'ed if omitted
 
         Returns:
             Processing statistics
         """
         logger.info(f"Starting streaming processing: {input_path}")
-        file_size = input_path.stat().st_size
+        if file_size is None:
+            file_size = input_path.stat().st_size
         logger.info(f"File size: {file_size:,} bytes")
 
         # Create output file
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(input_path, 'r', encoding='utf-8') as infile:
-            with open(output_path, 'w', encoding='utf-8') as outfile:
+        chunks = self._read_ahead(self._iter_file_chunks(input_path, file_size))
+        with closing(chunks):
+            with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as outfile:
                 overlap_buffer = ""
                 position = 0
 
-                for chunk in self._read_chunks(infile, self.chunk_size):
+                for chunk in chunks:
                     # Combine with overlap from previous chunk
                     text = overlap_buffer + chunk
 
@@ -110,16 +128,7 @@ class StreamingProcessor:
                         overlap_buffer = ""
 
                     # Process and write segments
-                    for segment in process_segments:
-                        result = self._process_segment(segment)
-
-                        if result:
-                            # Write JSONL
-                            json.dump(result, outfile, ensure_ascii=False)
-                            outfile.write('\n')
-                            self.stats['segments_written'] += 1
-
-                        self.stats['segments_processed'] += 1
+                    self._write_segments(process_segments, outfile)
 
                     self.stats['chunks_processed'] += 1
                     self.stats['bytes_processed'] += len(chunk)
@@ -139,20 +148,89 @@ class StreamingProcessor:
                 if overlap_buffer:
                     logger.debug("Processing final overlap buffer")
                     segments = self.segmenter.segment_text(overlap_buffer, granularity=self.granularity)
-
-                    for segment in segments:
-                        result = self._process_segment(segment)
-                        if result:
-                            json.dump(result, outfile, ensure_ascii=False)
-                            outfile.write('\n')
-                            self.stats['segments_written'] += 1
-                        self.stats['segments_processed'] += 1
+                    self._write_segments(segments, outfile)
 
         logger.info(f"Streaming processing complete. Processed {self.stats['segments_processed']} segments")
         logger.info(f"Written {self.stats['segments_written']} unique segments")
 
         return self.stats.copy()
 
+    def _write_segments(self, segments: List[Segment], outfile) -> None:
+        """
+        Process segments and write the results as JSONL in a single write.
+
+        Args:
+            segments: Segments from one chunk
+            outfile: Output file opened in binary mode
+        """
+        lines = []
+        for segment in segments:
+            result = self._process_segment(segment)
+            if result:
+                lines.append(encode_jsonl_line(result))
+
+        if lines:
+            outfile.write(b''.join(lines))
+
+        self.stats['segments_written'] += len(lines)
+        self.stats['segments_processed'] += len(segments)
+
+    def _iter_file_chunks(self, input_path: Path, file_size: int) -> Iterator[str]:
+        """
+        Read a file in chunks, memory-mapping it when it is large.
+
+        Args:
+            input_path: Path to input file
+            file_size: Size of the file in bytes
+
+        Yields:
+            Text chunks
+        """
+        if 0 < self.mmap_threshold <= file_size:
+            yield from self._read_mapped_chunks(input_path, self.chunk_size)
+        else:
+            with open(input_path, 'r', encoding='utf-8') as infile:
+                yield from self._read_chunks(infile, self.chunk_size)
+
+    def _read_mapped_chunks(self, input_path: Path, chunk_size: int) -> Iterator[str]:
+        """
+        Read a memory-mapped file in chunks.
+
+        Pages are faulted in on demand, so the file is not copied through a
+        userspace read buffer. Chunks match text-mode reads exactly: UTF-8
+        with universal newlines, cut into pieces of ``chunk_size`` decoded
+        characters rather than bytes.
+
+        Args:
+            input_path: Path to input file
+            chunk_size: Characters per chunk
+
+        Yields:
+            Text chunks
+        """
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder('utf-8')(), translate=True
+        )
+        # Decoded text not yet yielded; each slice of chunk_size bytes adds
+        # at most chunk_size characters, so this stays under two chunks
+        pending = ''
+
+        with open(input_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+            for start in range(0, len(mapped), chunk_size):
+                pending += decoder.decode(mapped[start:start + chunk_size])
+                while len(pending) >= chunk_size:
+                    logger.debug(f"Read mapped chunk of {chunk_size} characters")
+                    yield pending[:chunk_size]
+                    pending = pending[chunk_size:]
+
+        pending += decoder.decode(b'', final=True)
+        for start in range(0, len(pending), chunk_size):
+            yield pending[start:start + chunk_size]
+
     def _read_chunks(self, file_handle, chunk_size: int) -> Iterator[str]:
         """
         Read file in chunks.
@@ -172,6 +250,65 @@ class StreamingProcessor:
             logger.debug(f"Read chunk of {len(chunk)} characters")
             yield chunk
 
+    def _read_ahead(self, chunks: Iterator[str]) -> Iterator[str]:
+        """
+        Read chunks on a background thread so file I/O overlaps processing.
+
+        Chunks are yielded in order. At most ``self.read_ahead`` chunks are
+        buffered, and read errors are re-raised in the caller.
+
+        Args:
+            chunks: Chunk iterator to drain
+
+        Yields:
+            Text chunks
+        """
+        if self.read_ahead <= 0:
+            yield from chunks
+            return
+
+        buffer = queue.Queue(maxsize=self.read_ahead)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for chunk in chunks:
+                    if not put(chunk):
+                        return
+            except BaseException as exc:
+                put(exc)
+            else:
+                put(done)
+
+        reader = threading.Thread(target=produce, name='hydracontext-read-ahead', daemon=True)
+        reader.start()
+
+        try:
+            while True:
+                item = buffer.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Unblock and wait for the reader, then let the source close its file
+            stop.set()
+            reader.join()
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+
     def _process_segment(self, segment: Segment) -> Optional[Dict[str, Any]]:
         """
         Process a single segment.
@@ -231,18 +368,25 @@ class StreamingProcessor:
         return stats
 
 
-def should_use_streaming(file_path: Path, threshold_mb: int = 50) -> bool:
+def should_use_streaming(
+    file_path: Path,
+    threshold_mb: int = 50,
+    file_size: Optional[int] = None
+) -> bool:
     """
     Determine if streaming mode should be used for a file.
 
     Args:
         file_path: Path to file
         threshold_mb: Size threshold in MB
+        file_size: File size in bytes if already known; stat'ed if omitted
 
     Returns:
         True if streaming is recommended
     """
-    size_mb = file_path.stat().st_size / (1024 * 1024)
+    if file_size is None:
+        file_size = file_path.stat().st_size
+    size_mb = file_size / (1024 * 1024)
     should_stream = size_mb > threshold_mb
 
     if should_stream:
@@ -4,9 +4,34 @@ Input validation utilities for HydraContext.
 Provides validation for file paths, text content, and parameters.
 """
 
+import codecs
 import os
+import stat
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Optional, List
+
+from hydracontext.core.deduplicator import SUPPORTED_ALGORITHMS
+
+# Bytes per megabyte for file size limits
+_MB = 1 << 20
+
+# Bytes read per step by validate_text_encoding, and how much of the file
+# it checks by default
+_ENCODING_READ_SIZE = 64 * 1024
+_ENCODING_PROBE_SIZE = 64 * 1024
+
+# Accepted segmentation granularities
+_VALID_GRANULARITIES = frozenset({'sentence', 'paragraph'})
+
+# Recently missing paths (path -> monotonic time of the failed stat), used by
+# validate_file_readable(cache_misses=True)
+_MISSING_PATHS: 'OrderedDict[str, float]' = OrderedDict()
+_MISSING_PATHS_LOCK = threading.Lock()
+_MISSING_PATH_TTL = 1.0
+_MISSING_PATHS_MAX = 4096
 
 
 class ValidationError(Exception):
@@ -14,25 +39,84 @@ class ValidationError(Exception):
     pass
 
 
-def validate_file_readable(file_path: Path) -> None:
+def validate_file_readable(file_path: Path, cache_misses: bool = False) -> os.stat_result:
     """
     Validate that a file exists and is readable.
 
     Args:
         file_path: Path to file
+        cache_misses: Remember missing paths for about a second, so repeated
+            checks of the same missing path fail without another stat
+
+    Returns:
+        The file's stat result, for reuse by later checks
 
     Raises:
         ValidationError: If file doesn't exist or isn't readable
     """
-    if not file_path.exists():
+    key = os.fspath(file_path)
+    if cache_misses and _is_known_missing(key):
         raise ValidationError(f"File not found: {file_path}")
 
-    if not file_path.is_file():
+    # A single stat answers both the existence and the file-type checks
+    try:
+        stat_result = os.stat(key)
+    except (FileNotFoundError, NotADirectoryError):
+        if cache_misses:
+            _remember_missing(key)
+        raise ValidationError(f"File not found: {file_path}")
+    except OSError as e:
+        raise ValidationError(f"File not readable: {file_path}: {e}")
+
+    if not stat.S_ISREG(stat_result.st_mode):
         raise ValidationError(f"Not a file: {file_path}")
 
     if not os.access(file_path, os.R_OK):
         raise ValidationError(f"File not readable: {file_path}")
 
+    return stat_result
+
+
+def _is_known_missing(key: str) -> bool:
+    """Check whether a path failed to stat within the last TTL."""
+    with _MISSING_PATHS_LOCK:
+        missing_since = _MISSING_PATHS.get(key)
+        if missing_since is None:
+            return False
+        if time.monotonic() - missing_since < _MISSING_PATH_TTL:
+            return True
+        del _MISSING_PATHS[key]
+        return False
+
+
+def _remember_missing(key: str) -> None:
+    """Record a failed stat, evicting the oldest entries past the size cap."""
+    with _MISSING_PATHS_LOCK:
+        _MISSING_PATHS[key] = time.monotonic()
+        _MISSING_PATHS.move_to_end(key)
+        while len(_MISSING_PATHS) > _MISSING_PATHS_MAX:
+            _MISSING_PATHS.popitem(last=False)
+
+
+def validate_files_readable(file_paths: Iterable[Path]) -> List[os.stat_result]:
+    """
+    Validate many files, returning their stat results.
+
+    Each file gets the single-file check, so errors match
+    validate_file_readable. This is a convenience for callers that need
+    every size; it does not save syscalls over a loop.
+
+    Args:
+        file_paths: Paths to files
+
+    Returns:
+        Stat results in the same order as file_paths
+
+    Raises:
+        ValidationError: If any file doesn't exist or isn't readable
+    """
+    return [validate_file_readable(Path(path)) for path in file_paths]
+
 
 def validate_file_writable(file_path: Path) -> None:
     """
@@ -44,38 +128,56 @@ def validate_file_writable(file_path: Path) -> None:
     Raises:
         ValidationError: If path isn't writable
     """
-    # Check if parent directory exists
-    parent = file_path.parent
-    if not parent.exists():
-        try:
-            parent.mkdir(parents=True, exist_ok=True)
-        except OSError as e:
-            raise ValidationError(f"Cannot create directory {parent}: {e}")
+    # Create the parent directory if needed (a no-op when it already exists)
+    parent = os.path.dirname(os.fspath(file_path)) or '.'
+    try:
+        os.makedirs(parent, exist_ok=True)
+    except OSError as e:
+        raise ValidationError(f"Cannot create directory {parent}: {e}")
 
     # Check if directory is writable
     if not os.access(parent, os.W_OK):
         raise ValidationError(f"Directory not writable: {parent}")
 
     # If file exists, check if it's writable
-    if file_path.exists() and not os.access(file_path, os.W_OK):
+    if os.path.exists(file_path) and not os.access(file_path, os.W_OK):
         raise ValidationError(f"File not writable: {file_path}")
 
 
-def validate_text_encoding(file_path: Path, encoding: str = 'utf-8') -> None:
+def validate_text_encoding(
+    file_path: Path,
+    encoding: str = 'utf-8',
+    max_bytes: Optional[int] = _ENCODING_PROBE_SIZE
+) -> None:
     """
     Validate that a file can be read with specified encoding.
 
     Args:
         file_path: Path to file
         encoding: Text encoding to validate
+        max_bytes: How much of the start of the file to decode (64 KiB by
+            default); None decodes the whole file
 
     Raises:
         ValidationError: If file cannot be decoded
     """
     try:
-        with open(file_path, 'r', encoding=encoding) as f:
-            # Try to read first 1KB
-            f.read(1024)
+        # One decoder across reads carries over split characters, and the
+        # first invalid sequence stops the scan
+        decoder = codecs.getincrementaldecoder(encoding)(errors='strict')
+        with open(file_path, 'rb') as f:
+            checked = 0
+            while max_bytes is None or checked < max_bytes:
+                size = _ENCODING_READ_SIZE
+                if max_bytes is not None:
+                    size = min(size, max_bytes - checked)
+                block = f.read(size)
+                if not block:
+                    # End of file: a character cut off here is an error
+                    decoder.decode(b'', final=True)
+                    break
+                decoder.decode(block)
+                checked += len(block)
     except UnicodeDecodeError as e:
         raise ValidationError(f"File encoding error in {file_path}: {e}")
     except Exception as e:
@@ -97,11 +199,12 @@ def validate_text_content(text: str, min_length: int = 1, max_length: Optional[i
     if not isinstance(text, str):
         raise ValidationError(f"Expected string, got {type(text).__name__}")
 
-    if len(text) < min_length:
-        raise ValidationError(f"Text too short: {len(text)} < {min_length}")
+    length = len(text)
+    if length < min_length:
+        raise ValidationError(f"Text too short: {length} < {min_length}")
 
-    if max_length and len(text) > max_length:
-        raise ValidationError(f"Text too long: {len(text)} > {max_length}")
+    if max_length and length > max_length:
+        raise ValidationError(f"Text too long: {length} > {max_length}")
 
 
 def validate_granularity(granularity: str) -> None:
@@ -114,10 +217,10 @@ def validate_granularity(granularity: str) -> None:
     Raises:
         ValidationError: If granularity is invalid
     """
-    valid_values = ['sentence', 'paragraph']
-    if granularity not in valid_values:
+    if granularity not in _VALID_GRANULARITIES:
         raise ValidationError(
-            f"Invalid granularity '{granularity}'. Must be one of: {', '.join(valid_values)}"
+            f"Invalid granularity '{granularity}'. "
+            f"Must be one of: {', '.join(sorted(_VALID_GRANULARITIES))}"
         )
 
 
@@ -131,10 +234,10 @@ def validate_hash_algorithm(algorithm: str) -> None:
     Raises:
         ValidationError: If algorithm is invalid
     """
-    valid_algorithms = ['md5', 'sha256', 'blake2b']
-    if algorithm not in valid_algorithms:
+    if algorithm not in SUPPORTED_ALGORITHMS:
         raise ValidationError(
-            f"Invalid algorithm '{algorithm}'. Must be one of: {', '.join(valid_algorithms)}"
+            f"Invalid algorithm '{algorithm}'. "
+            f"Must be one of: {', '.join(sorted(SUPPORTED_ALGORITHMS))}"
         )
 
 
@@ -148,20 +251,33 @@ def validate_confidence_threshold(threshold: float) -> None:
     Raises:
         ValidationError: If threshold is invalid
     """
-    if not isinstance(threshold, (int, float)):
+    # Non-numbers fail the comparison itself, so no separate type check
+    try:
+        in_range = 0.0 <= threshold <= 1.0
+    except TypeError:
         raise ValidationError(f"Threshold must be a number, got {type(threshold).__name__}")
 
-    if not 0.0 <= threshold <= 1.0:
+    if not in_range:
         raise ValidationError(f"Threshold must be between 0.0 and 1.0, got {threshold}")
 
 
-def validate_file_size(file_path: Path, max_size_mb: Optional[int] = None) -> int:
+def validate_file_size(
+    file_path: Path,
+    max_size_mb: Optional[int] = None,
+    stat_result: Optional[os.stat_result] = None,
+    *,
+    max_bytes: Optional[int] = None
+) -> int:
     """
     Validate file size and return size in bytes.
 
     Args:
         file_path: Path to file
         max_size_mb: Optional maximum file size in MB
+        stat_result: Stat result already taken for file_path (e.g. from
+            validate_file_readable); the file is stat'ed if omitted
+        max_bytes: Optional maximum file size in bytes; takes precedence
+            over max_size_mb
 
     Returns:
         File size in bytes
@@ -169,15 +285,20 @@ def validate_file_size(file_path: Path, max_size_mb: Optional[int] = None) -> in
     Raises:
         ValidationError: If file is too large
     """
-    size_bytes = file_path.stat().st_size
+    if stat_result is None:
+        stat_result = os.stat(file_path)
+    size_bytes = stat_result.st_size
 
-    if max_size_mb:
-        max_size_bytes = max_size_mb * 1024 * 1024
-        if size_bytes > max_size_bytes:
-            size_mb = size_bytes / (1024 * 1024)
+    if max_bytes is not None:
+        if size_bytes > max_bytes:
             raise ValidationError(
-                f"File too large: {size_mb:.1f}MB > {max_size_mb}MB. "
+                f"File too large: {size_bytes} bytes > {max_bytes} bytes. "
                 "Consider using streaming mode."
             )
+    elif max_size_mb and size_bytes > max_size_mb * _MB:
+        raise ValidationError(
+            f"File too large: {size_bytes / _MB:.1f}MB > {max_size_mb}MB. "
+            "Consider using streaming mode."
+        )
 
     return size_bytes
@@ -37,6 +37,12 @@ setup(
         # No dependencies - uses stdlib only!
     ],
     extras_require={
+        "fast": [
+            "hyperscan>=0.4.0",
+            "blake3>=0.3.0",
+            "orjson>=3.6.0",
+            "xxhash>=3.0.0",
+        ],
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
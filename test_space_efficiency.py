@@ -5,6 +5,7 @@ Test to measure actual context space savings vs overhead.
 
 import json
 import sys
+from operator import attrgetter, itemgetter
 from pathlib import Path
 
 # Add to path for imports
@@ -17,6 +18,53 @@ from hydracontext import (
 )
 from hydracontext.core.prompt_processor import PromptProcessor
 
+# Stateless components are shared by all tests; deduplicators and prompt
+# processors keep per-run state and are created inside each test.
+_SEGMENTER = ContextSegmenter()
+_CLASSIFIER = ContentClassifier()
+
+
+class _CountingIO:
+    """Write-only sink that counts characters instead of storing them."""
+
+    def __init__(self):
+        self.n = 0
+
+    def write(self, s):
+        self.n += len(s)
+        return len(s)
+
+
+# One sink is reused for every measurement
+_SIZER = _CountingIO()
+
+
+def serialized_size(obj) -> int:
+    """Length of json.dumps(obj) without building the serialized string."""
+    _SIZER.n = 0
+    json.dump(obj, _SIZER)
+    return _SIZER.n
+
+
+def process_docs(docs, segmenter, deduplicator=None, classifier=None):
+    """
+    Segment documents, deduplicating and classifying segments as they stream by.
+
+    Returns:
+        Tuple of (all segments, texts kept after deduplication, their classifications)
+    """
+    all_segments = []
+    kept_texts = []
+
+    for doc in docs:
+        for seg in segmenter.segment_text(doc, granularity='sentence'):
+            all_segments.append(seg)
+            if deduplicator is None or not deduplicator.is_duplicate(seg.text, record=True):
+                kept_texts.append(seg.text)
+
+    classifications = classifier.classify_batch(kept_texts) if classifier else []
+    return all_segments, kept_texts, classifications
+
 
 def test_raw_vs_processed_size():
     """Compare raw text size vs processed output size."""
@@ -43,29 +91,28 @@ def test_raw_vs_processed_size():
     original_size = len(test_text)
     print(f"\n📏 Original text: {original_size} bytes ({original_size} chars)")
 
-    # Process with segmentation only
-    segmenter = ContextSegmenter()
-    segments = segmenter.segment_text(test_text, granularity='sentence')
+    # Process with segmentation only (without deduplication every text is kept)
+    segments, texts, _ = process_docs([test_text], _SEGMENTER)
+
+    # Segment metadata as parallel columns
+    types = [seg.type.value for seg in segments]
+    starts = [seg.start_pos for seg in segments]
+    ends = [seg.end_pos for seg in segments]
+    lengths = [len(t) for t in texts]
 
     # Calculate size of just the text content
-    segmented_text_size = sum(len(seg.text) for seg in segments)
+    segmented_text_size = sum(lengths)
     print(f"📏 Segmented text only: {segmented_text_size} bytes")
     print(f"   Overhead from segmentation: {segmented_text_size - original_size:+d} bytes")
 
-    # Calculate size with metadata (as JSONL)
-    segments_with_metadata = []
-    for seg in segments:
-        segment_dict = {
-            'text': seg.text,
-            'type': seg.type.value,
-            'start_pos': seg.start_pos,
-            'end_pos': seg.end_pos,
-            'length': len(seg.text)
-        }
-        segments_with_metadata.append(segment_dict)
-
-    jsonl_output = '\n'.join(json.dumps(s) for s in segments_with_metadata)
-    jsonl_size = len(jsonl_output)
+    # Calculate size with metadata (as JSONL), encoding the rows in one batch
+    encode = json.JSONEncoder().encode
+    jsonl_lines = [
+        encode({'text': t, 'type': ty, 'start_pos': s, 'end_pos': e, 'length': n})
+        for t, ty, s, e, n in zip(texts, types, starts, ends, lengths)
+    ]
+    # Lines plus the newlines between them, without joining into one buffer
+    jsonl_size = sum(map(len, jsonl_lines)) + max(len(jsonl_lines) - 1, 0)
 
     print(f"📏 With metadata (JSONL): {jsonl_size} bytes")
     print(f"   Overhead from metadata: {jsonl_size - original_size:+d} bytes "
@@ -94,19 +141,15 @@ def test_deduplication_savings():
     ]
 
     # Original size
-    original_size = sum(len(t) for t in texts)
+    original_size = sum(map(len, texts))
     original_count = len(texts)
     print(f"\n📊 Original: {original_count} texts, {original_size} bytes")
 
     # With deduplication
     deduplicator = ContentDeduplicator()
-    unique_texts = []
-
-    for text in texts:
-        if not deduplicator.is_duplicate(text, record=True):
-            unique_texts.append(text)
+    unique_texts = deduplicator.bulk_filter(texts)
 
-    deduplicated_size = sum(len(t) for t in unique_texts)
+    deduplicated_size = sum(map(len, unique_texts))
     unique_count = len(unique_texts)
 
     stats = deduplicator.get_statistics()
@@ -132,7 +175,7 @@ def test_prompt_processing_overhead():
         "Write a Python function to calculate fibonacci numbers",
     ]
 
-    total_original = sum(len(p) for p in prompts)
+    total_original = sum(map(len, prompts))
     print(f"\n📏 Original prompts: {total_original} bytes")
 
     # Process with PromptProcessor
@@ -144,11 +187,11 @@ def test_prompt_processing_overhead():
         all_results.extend(result)
 
     # Calculate processed size (just content)
-    content_size = sum(len(r['content']) for r in all_results)
+    content_size = sum(map(len, map(itemgetter('content'), all_results)))
     print(f"📏 Processed content: {content_size} bytes")
 
     # Calculate with metadata
-    json_size = len(json.dumps(all_results))
+    json_size = serialized_size(all_results)
     print(f"📏 With full metadata (JSON): {json_size} bytes")
     print(f"   Metadata overhead: {json_size - total_original:+d} bytes "
           f"({(json_size / total_original - 1) * 100:.1f}% increase)")
@@ -176,28 +219,32 @@ def test_classification_overhead():
         '{"name": "test", "value": 123}',
     ]
 
-    total_size = sum(len(t) for t in texts)
+    total_size = sum(map(len, texts))
     print(f"\n📏 Original texts: {total_size} bytes")
 
-    classifier = ContentClassifier()
-
     # Without classification (just text)
     basic_output = [{'text': t} for t in texts]
-    basic_size = len(json.dumps(basic_output))
+    basic_size = serialized_size(basic_output)
     print(f"📏 As JSON without classification: {basic_size} bytes")
 
-    # With classification
-    classified_output = []
-    for text in texts:
-        classification = classifier.classify(text)
-        classified_output.append({
-            'text': text,
-            'type': classification.content_type.value,
-            'confidence': classification.confidence,
-            'indicators': classification.indicators
-        })
-
-    classified_size = len(json.dumps(classified_output))
+    # With classification; rows have a fixed schema, so only the free-form
+    # fields go through the JSON encoder
+    row_template = (
+        '{{"text": {text}, "type": "{type}", '
+        '"confidence": {confidence}, "indicators": {indicators}}}'
+    )
+    classified_rows = [
+        row_template.format(
+            text=json.dumps(text),
+            type=classification.content_type.value,
+            confidence=repr(classification.confidence),
+            indicators=json.dumps(classification.indicators)
+        )
+        for text, classification in zip(texts, _CLASSIFIER.classify_batch(texts))
+    ]
+
+    # Same length as json.dumps of the row list: brackets plus ", " separators
+    classified_size = sum(map(len, classified_rows)) + 2 * max(len(classified_rows), 1)
     print(f"📏 With classification metadata: {classified_size} bytes")
     print(f"   Classification overhead: {classified_size - basic_size:+d} bytes "
           f"({(classified_size / basic_size - 1) * 100:.1f}% increase)")
@@ -231,45 +278,38 @@ def test_realistic_scenario():
     ]
 
     # Original size
-    total_original = sum(len(doc) for doc in documents)
+    total_original = sum(map(len, documents))
     doc_count = len(documents)
     print(f"\n📚 Processing {doc_count} documents")
     print(f"📏 Total original size: {total_original} bytes")
 
     # Process with segmentation, classification, and deduplication
-    segmenter = ContextSegmenter()
-    classifier = ContentClassifier()
     deduplicator = ContentDeduplicator()
 
-    all_segments = []
-    unique_segments = []
-
-    for doc in documents:
-        segments = segmenter.segment_text(doc, granularity='sentence')
-
-        for seg in segments:
-            # Check for duplicate
-            is_dup = deduplicator.is_duplicate(seg.text, record=True)
-
-            if not is_dup:
-                classification = classifier.classify(seg.text)
-                unique_segments.append({
-                    'text': seg.text,
-                    'type': classification.content_type.value,
-                    'confidence': classification.confidence
-                })
-
-            all_segments.append(seg)
+    # Only first occurrences get classified
+    all_segments, unique_texts, classifications = process_docs(
+        documents, _SEGMENTER, deduplicator, _CLASSIFIER
+    )
 
     # Calculate sizes
-    all_text_size = sum(len(seg.text) for seg in all_segments)
-    unique_text_size = sum(len(seg['text']) for seg in unique_segments)
-    json_size = len(json.dumps(unique_segments))
+    all_text_size = sum(map(len, map(attrgetter('text'), all_segments)))
+    unique_text_size = sum(map(len, unique_texts))
+
+    # Size of the unique segments as a JSON list of {text, type, confidence}
+    # rows, computed from field lengths; only the text needs escaping
+    row_overhead = len('{"text": , "type": "", "confidence": }')
+    json_size = 2 * max(len(unique_texts), 1) + sum(
+        row_overhead
+        + len(json.dumps(text))
+        + len(classification.content_type.value)
+        + len(repr(classification.confidence))
+        for text, classification in zip(unique_texts, classifications)
+    )
 
     print(f"\n📊 Results:")
     print(f"   Total segments: {len(all_segments)}")
-    print(f"   Unique segments: {len(unique_segments)}")
-    print(f"   Duplicates removed: {len(all_segments) - len(unique_segments)}")
+    print(f"   Unique segments: {len(unique_texts)}")
+    print(f"   Duplicates removed: {len(all_segments) - len(unique_texts)}")
 
     print(f"\n💾 Storage comparison:")
     print(f"   Original docs: {total_original} bytes (baseline)")
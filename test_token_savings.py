@@ -5,6 +5,7 @@ This is the REAL value proposition of HydraContext.
 """
 
 import sys
+from collections import Counter
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
@@ -13,9 +14,17 @@ from hydracontext import ContentDeduplicator
 from hydracontext.core.prompt_processor import PromptProcessor
 
 
-def estimate_tokens(text: str) -> int:
-    """Rough token estimate (chars / 4)."""
-    return len(text) // 4
+def count_chars_and_tokens(texts):
+    """Total characters and rough token estimate (chars / 4 per text).
+
+    Each distinct text is measured once and weighted by how often it occurs.
+    """
+    total_chars = total_tokens = 0
+    for text, count in Counter(texts).items():
+        n = len(text)
+        total_chars += n * count
+        total_tokens += (n // 4) * count
+    return total_chars, total_tokens
 
 
 def test_token_savings():
@@ -40,8 +49,7 @@ def test_token_savings():
 
     # Original stats
     total_prompts = len(prompts)
-    total_chars = sum(len(p) for p in prompts)
-    total_tokens = sum(estimate_tokens(p) for p in prompts)
+    total_chars, total_tokens = count_chars_and_tokens(prompts)
 
     print(f"\n📊 ORIGINAL (without HydraContext):")
     print(f"   Prompts: {total_prompts}")
@@ -53,15 +61,13 @@ def test_token_savings():
     unique_prompts = []
     duplicate_count = 0
 
-    for prompt in prompts:
-        result = processor.process(prompt)
+    for prompt, result in zip(prompts, processor.process_batch(prompts)):
         if not result[0].get('duplicate', False):
             unique_prompts.append(prompt)
         else:
             duplicate_count += 1
 
-    unique_chars = sum(len(p) for p in unique_prompts)
-    unique_tokens = sum(estimate_tokens(p) for p in unique_prompts)
+    unique_chars, unique_tokens = count_chars_and_tokens(unique_prompts)
 
     print(f"\n✅ AFTER DEDUPLICATION (with HydraContext):")
     print(f"   Unique prompts: {len(unique_prompts)}")
@@ -136,7 +142,7 @@ def test_embedding_savings():
     ]
 
     total_docs = len(documents)
-    total_chars = sum(len(d) for d in documents)
+    total_chars, total_tokens = count_chars_and_tokens(documents)
 
     print(f"\n📚 DOCUMENTS TO EMBED:")
     print(f"   Total documents: {total_docs}")
@@ -144,14 +150,10 @@ def test_embedding_savings():
 
     # Deduplicate
     deduplicator = ContentDeduplicator()
-    unique_docs = []
-
-    for doc in documents:
-        if not deduplicator.is_duplicate(doc, record=True):
-            unique_docs.append(doc)
+    unique_docs = deduplicator.bulk_filter(documents)
 
     unique_count = len(unique_docs)
-    unique_chars = sum(len(d) for d in unique_docs)
+    unique_chars = sum(map(len, unique_docs))
 
     print(f"\n✅ AFTER DEDUPLICATION:")
     print(f"   Unique documents: {unique_count}")
@@ -161,7 +163,7 @@ def test_embedding_savings():
     # Embedding costs
     # OpenAI ada-002: $0.0001 per 1K tokens
     cost_per_1k_tokens = 0.0001
-    avg_tokens_per_doc = sum(estimate_tokens(d) for d in documents) / len(documents)
+    avg_tokens_per_doc = total_tokens / len(documents)
 
     original_embedding_cost = (total_docs * avg_tokens_per_doc / 1000) * cost_per_1k_tokens
     dedup_embedding_cost = (unique_count * avg_tokens_per_doc / 1000) * cost_per_1k_tokens
@@ -0,0 +1,24 @@
+"""Shared pytest fixtures."""
+
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def tmp_files(tmp_path_factory):
+    """Create sample files once per session, keyed by name."""
+    directory = tmp_path_factory.mktemp("val")
+
+    small = directory / "small.txt"
+    small.touch()
+    os.truncate(small, 1000)  # 1KB file, sized without writing data
+
+    utf8 = directory / "utf8.txt"
+    utf8.write_text("Hello, World! 你好", encoding='utf-8')
+
+    big = directory / "big.bin"
+    big.touch()
+    os.truncate(big, 2 * 1024 * 1024)  # 2MB sparse file
+
+    return {'small': small, 'utf8': utf8, 'big': big}
@@ -1,7 +1,12 @@
 """Tests for the ContentClassifier."""
 
+import pickle
 import pytest
-from hydracontext.core.classifier import ContentClassifier, ContentType
+from hydracontext.core.classifier import (
+    ContentClassifier,
+    ContentType,
+    _count_matching_patterns,
+)
 
 
 def test_basic_code_detection():
@@ -182,5 +187,76 @@ def test_markdown_prose():
     assert result.content_type in [ContentType.PROSE, ContentType.MIXED]
 
 
+def test_classify_batch():
+    """Test that batch classification matches per-text classification."""
+    classifier = ContentClassifier()
+
+    texts = [
+        "The cat is on the mat. It is a very nice cat.",
+        "function test() { return class instance; }",
+        '{"name": "John", "age": 30}',
+        "The cat is on the mat. It is a very nice cat.",
+    ]
+
+    results = classifier.classify_batch(texts)
+
+    assert len(results) == len(texts)
+    for text, result in zip(texts, results):
+        expected = classifier.classify(text)
+        assert result.content_type == expected.content_type
+        assert result.confidence == expected.confidence
+
+
+def test_repeated_classification_returns_independent_results():
+    """Test that cached classifications are not shared between callers."""
+    classifier = ContentClassifier()
+
+    text = "The cat is on the mat. It is a very nice cat."
+    first = classifier.classify(text)
+    first.metadata['note'] = 'changed'
+    second = classifier.classify(text)
+
+    assert second.content_type == first.content_type
+    assert second.confidence == first.confidence
+    assert 'note' not in second.metadata
+
+
+def test_pickle_roundtrip():
+    """Test that a classifier survives pickling and classifies the same."""
+    classifier = ContentClassifier(threshold=0.7, cache_size=8)
+    code = "def add(a, b):\n    return a + b\n"
+    expected = classifier.classify(code)
+
+    restored = pickle.loads(pickle.dumps(classifier))
+
+    assert restored.threshold == 0.7
+    assert restored.classify(code) == expected
+
+
+def test_hyperscan_pattern_counts_match_re():
+    """Test that the Hyperscan database counts the same matches as re."""
+    pytest.importorskip("hyperscan")
+    classifier = ContentClassifier()
+    assert classifier._code_database is not None
+
+    samples = [
+        "def add(a, b):\n    return a + b\n",
+        "import os\nclass Foo:\n    pass\n",
+        "function f(x) { return x; }\nconst y = f(1);",
+        "The quick brown fox jumps over the lazy dog. It was a sunny day.",
+        "Café naïve résumé — plain prose with unicode ☕.",
+        "",
+    ]
+    counts = []
+    for text in samples:
+        count = _count_matching_patterns(
+            classifier._code_regexes, classifier._code_database, text
+        )
+        assert count == _count_matching_patterns(classifier._code_regexes, None, text)
+        counts.append(count)
+
+    assert counts[0] > 0 and counts[-1] == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
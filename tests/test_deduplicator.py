@@ -1,7 +1,9 @@
 """Tests for the ContentDeduplicator."""
 
+import pickle
 import pytest
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from hydracontext.core.deduplicator import ContentDeduplicator, ContentHash
 
@@ -29,6 +31,49 @@ def test_different_hash_algorithms():
         assert dedup.is_duplicate(text) is True
 
 
+def test_blake3_algorithm():
+    """Test the optional BLAKE3 algorithm."""
+    blake3 = pytest.importorskip("blake3")
+    dedup = ContentDeduplicator(algorithm='blake3')
+
+    text = "A sentence long enough to track"
+    assert dedup.is_duplicate(text) is False
+    assert dedup.is_duplicate(text) is True
+    assert dedup.hash_text(text) == blake3.blake3(
+        dedup._normalize_text(text).encode('utf-8')
+    ).hexdigest()[:32]
+
+
+def test_xxh3_algorithm():
+    """Test the optional XXH3 algorithm."""
+    xxhash = pytest.importorskip("xxhash")
+    dedup = ContentDeduplicator(algorithm='xxh3')
+
+    text = "A sentence long enough to track"
+    assert dedup.is_duplicate(text) is False
+    assert dedup.is_duplicate(text) is True
+    assert dedup.hash_text(text) == xxhash.xxh3_128(
+        dedup._normalize_text(text).encode('utf-8')
+    ).hexdigest()
+
+
+def test_digest_cache_size():
+    """Test that digest memoization does not change results."""
+    cached = ContentDeduplicator()
+    uncached = ContentDeduplicator(digest_cache_size=0)
+
+    text = "A sentence long enough to track"
+    assert cached.hash_text(text) == uncached.hash_text(text)
+    assert cached.is_duplicate(text) is uncached.is_duplicate(text) is False
+    assert cached.is_duplicate(text) is uncached.is_duplicate(text) is True
+
+
+def test_unsupported_hash_algorithm():
+    """Test that unknown algorithms are rejected at construction."""
+    with pytest.raises(ValueError, match="Unsupported algorithm"):
+        ContentDeduplicator(algorithm='sha512')
+
+
 def test_normalization():
     """Test that normalization finds similar text."""
     dedup = ContentDeduplicator(normalize=True)
@@ -88,6 +133,41 @@ def test_deduplicate_list():
     assert "Fourth text" in unique
 
 
+def test_deduplicate_list_with_executor():
+    """Test that hashing on an executor gives the same result as serial hashing."""
+    texts = [f"Repeated text number {i % 1500}" for i in range(5000)]
+
+    serial = ContentDeduplicator().deduplicate_list(texts)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        threaded = ContentDeduplicator().deduplicate_list(texts, executor=executor)
+
+    assert threaded == serial
+    assert len(threaded) == 1500
+
+
+def test_pickle_roundtrip():
+    """Test that a deduplicator survives pickling with its records."""
+    dedup = ContentDeduplicator(digest_cache_size=16)
+    dedup.is_duplicate("A sentence long enough to track")
+
+    restored = pickle.loads(pickle.dumps(dedup))
+
+    assert restored.is_duplicate("A sentence long enough to track") is True
+    assert restored.is_duplicate("Another sentence long enough") is False
+    assert restored._digest.cache_info().maxsize == 16
+
+
+def test_deduplicate_list_with_process_pool():
+    """Test hashing on a process pool."""
+    dedup = ContentDeduplicator()
+    texts = [f"Sentence number {i % 700} that is long enough" for i in range(3000)]
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = dedup.deduplicate_list(texts, executor=executor)
+
+    assert result == ContentDeduplicator().deduplicate_list(texts)
+
+
 def test_statistics():
     """Test statistics tracking."""
     dedup = ContentDeduplicator()
@@ -139,6 +219,73 @@ def test_cache_persistence():
         assert dedup2.is_duplicate("Text 3") is False
 
 
+def test_cache_roundtrip_preserves_records():
+    """Test that a reloaded cache keeps previews and occurrence counts."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "cache.jsonl"
+        text = "Ünïcödé text that is long enough"
+
+        dedup1 = ContentDeduplicator(cache_path=cache_path)
+        dedup1.is_duplicate(text)
+        dedup1.is_duplicate(text)
+        dedup1.save_cache()
+
+        dedup2 = ContentDeduplicator(cache_path=cache_path)
+
+        assert dedup2.get_hash_info(text) == dedup1.get_hash_info(text)
+        assert dedup2.get_statistics()['unique_content'] == 1
+
+
+def test_full_digests():
+    """Test truncated and full-length digest keys."""
+    text = "A sentence long enough to track"
+    truncated = ContentDeduplicator()
+    full = ContentDeduplicator(full_digests=True)
+
+    assert len(truncated.hash_text(text)) == 32
+    assert len(full.hash_text(text)) == 64
+    assert full.hash_text(text).startswith(truncated.hash_text(text))
+
+
+def test_cache_with_full_digests_loads_truncated():
+    """Test that caches written with full digests still match."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "cache.jsonl"
+        text = "A sentence long enough to track"
+
+        dedup1 = ContentDeduplicator(cache_path=cache_path, full_digests=True)
+        dedup1.is_duplicate(text)
+        dedup1.save_cache()
+
+        dedup2 = ContentDeduplicator(cache_path=cache_path)
+        assert dedup2.get_hash_info(text).hash == dedup2.hash_text(text)
+        assert dedup2.is_duplicate(text) is True
+
+
+def test_truncated_cache_rejected_with_full_digests():
+    """Test that a truncated cache cannot be loaded for full-length keys."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = Path(tmpdir) / "cache.jsonl"
+
+        dedup1 = ContentDeduplicator(cache_path=cache_path)
+        dedup1.is_duplicate("A sentence long enough to track")
+        dedup1.save_cache()
+
+        with pytest.raises(ValueError, match="16-byte digests"):
+            ContentDeduplicator(cache_path=cache_path, full_digests=True)
+
+
+def test_seen_hashes_are_hex_digests():
+    """Test that seen_hashes holds the hex digests returned by hash_text."""
+    dedup = ContentDeduplicator()
+    text = "A sentence long enough to track"
+
+    dedup.is_duplicate(text)
+
+    assert dedup.hash_text(text) in dedup.seen_hashes
+    assert dedup.seen_hashes == {dedup.hash_text(text)}
+
+
 def test_clear_cache():
     """Test clearing the cache."""
     dedup = ContentDeduplicator()
@@ -215,5 +362,44 @@ def test_record_parameter():
     assert dedup.get_statistics()['unique_content'] == 1
 
 
+def test_add_if_new():
+    """Test recording text and reporting whether it was new."""
+    dedup = ContentDeduplicator()
+
+    text = "A sentence long enough to track"
+
+    assert dedup.add_if_new(text) is True
+    assert dedup.add_if_new(text) is False
+    assert dedup.add_if_new("Short") is True  # Below min_length, always kept
+
+    stats = dedup.get_statistics()
+    assert stats['unique_content'] == 1
+    assert stats['duplicates_found'] == 1
+    assert dedup.get_hash_info(text).occurrences == 2
+
+
+def test_bulk_filter():
+    """Test filtering a batch against everything recorded so far."""
+    dedup = ContentDeduplicator()
+    dedup.add_if_new("A sentence long enough to track")
+
+    texts = [
+        "A sentence long enough to track",
+        "Another sentence long enough",
+        "Short",
+        "Another sentence long enough",
+        "Short",
+    ]
+
+    unique = dedup.bulk_filter(texts)
+
+    assert unique == ["Another sentence long enough", "Short", "Short"]
+
+    stats = dedup.get_statistics()
+    assert stats['unique_content'] == 2
+    assert stats['duplicates_found'] == 2
+    assert dedup.get_hash_info("Another sentence long enough").occurrences == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
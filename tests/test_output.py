@@ -4,7 +4,9 @@ import pytest
 import tempfile
 import json
 from pathlib import Path
-from hydracontext.utils.output import OutputWriter, StatsCollector
+from datetime import datetime
+from hydracontext.utils import output
+from hydracontext.utils.output import OutputWriter, StatsCollector, encode_jsonl_line
 
 
 def test_write_jsonl():
@@ -44,6 +46,55 @@ def test_write_jsonl_append():
         assert len(lines) == 2
 
 
+def test_write_jsonl_roundtrip_unusual_values():
+    """Test values that need the stdlib fallback or non-ASCII output."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "output.jsonl"
+
+        data = [
+            {'text': 'café ☕'},
+            {1: 'integer key'},
+            {'big': 2 ** 70},
+        ]
+
+        OutputWriter.write_jsonl(data, output_path)
+
+        assert 'café ☕' in output_path.read_text(encoding='utf-8')
+        assert OutputWriter.read_jsonl(output_path) == [
+            {'text': 'café ☕'},
+            {'1': 'integer key'},
+            {'big': 2 ** 70},
+        ]
+
+
+def test_encode_jsonl_line_non_finite_floats():
+    """Test that NaN and infinities are written as the stdlib writes them."""
+    item = {'score': float('nan'), 'bounds': [float('-inf'), float('inf')], 'none': None}
+
+    assert encode_jsonl_line(item) == (
+        json.dumps(item, separators=(',', ':')) + '\n'
+    ).encode('utf-8')
+
+
+def test_encode_jsonl_line_backends_agree(monkeypatch):
+    """Test that orjson and the stdlib encode the same record identically."""
+    pytest.importorskip("orjson")
+    record = {
+        'text': 'café ☕ "quoted"\n',
+        'values': [1, -2.5, 0.1, True, None],
+        'nested': {'empty': [], 'score': float('nan')},
+    }
+
+    fast = encode_jsonl_line(record)
+    with pytest.raises(TypeError):
+        encode_jsonl_line({'when': datetime(2024, 1, 1)})
+
+    monkeypatch.setattr(output, 'orjson', None)
+    assert encode_jsonl_line(record) == fast
+    with pytest.raises(TypeError):
+        encode_jsonl_line({'when': datetime(2024, 1, 1)})
+
+
 def test_read_jsonl():
     """Test reading JSONL format."""
     with tempfile.TemporaryDirectory() as tmpdir:
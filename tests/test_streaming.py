@@ -1,5 +1,6 @@
 """Tests for streaming utilities."""
 
+import pickle
 import pytest
 import tempfile
 from pathlib import Path
@@ -31,6 +32,14 @@ def test_should_use_streaming_small_file():
         temp_path.unlink()
 
 
+def test_should_use_streaming_known_size():
+    """Test that a known size is used without touching the file."""
+    missing = Path("/this/does/not/exist.txt")
+
+    assert should_use_streaming(missing, threshold_mb=50, file_size=60 * 1024 * 1024) is True
+    assert should_use_streaming(missing, threshold_mb=50, file_size=1024) is False
+
+
 def test_streaming_processor_init():
     """Test initializing streaming processor."""
     processor = StreamingProcessor(
@@ -98,6 +107,71 @@ def test_streaming_process_file():
         assert len(lines) > 0
 
 
+def test_streaming_read_ahead_matches_inline_reads():
+    """Test that background read-ahead yields the same output as inline reads."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = Path(tmpdir) / "input.txt"
+        input_path.write_text(" ".join(
+            f"This is sentence number {i}." for i in range(200)
+        ))
+
+        outputs = []
+        for read_ahead in (0, 2):
+            output_path = Path(tmpdir) / f"output_{read_ahead}.jsonl"
+            processor = StreamingProcessor(chunk_size=100, read_ahead=read_ahead)
+            processor.process_file_streaming(input_path, output_path)
+            outputs.append(output_path.read_text())
+
+        assert outputs[0] == outputs[1]
+
+
+def test_streaming_read_ahead_propagates_errors():
+    """Test that read errors on the background thread reach the caller."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = Path(tmpdir) / "input.txt"
+        input_path.write_bytes(b"Valid text. " * 50 + b"\xff\xfe invalid")
+
+        processor = StreamingProcessor(chunk_size=100, read_ahead=2)
+
+        with pytest.raises(UnicodeDecodeError):
+            processor.process_file_streaming(input_path, Path(tmpdir) / "output.jsonl")
+
+
+def test_streaming_mmap_matches_buffered_reads():
+    """Test that memory-mapped input yields the same output as buffered reads."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = Path(tmpdir) / "input.txt"
+        input_path.write_bytes("".join(
+            f"Café ☕ sentence number {i}.\r\nA naïve line {i % 7}.\r\n" for i in range(200)
+        ).encode('utf-8'))
+
+        processor = StreamingProcessor()
+        with open(input_path, 'r', encoding='utf-8') as infile:
+            buffered = list(processor._read_chunks(infile, 100))
+        assert list(processor._read_mapped_chunks(input_path, 100)) == buffered
+
+        outputs = []
+        for mmap_threshold in (0, 1):
+            output_path = Path(tmpdir) / f"output_{mmap_threshold}.jsonl"
+            processor = StreamingProcessor(chunk_size=100, mmap_threshold=mmap_threshold)
+            processor.process_file_streaming(input_path, output_path)
+            outputs.append(output_path.read_text())
+
+        assert outputs[0] == outputs[1]
+
+
+def test_streaming_mmap_decodes_split_characters():
+    """Test that multi-byte characters and CRLF pairs split across chunks decode intact."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        input_path = Path(tmpdir) / "input.txt"
+        input_path.write_bytes("Café ☕ naïve.\r\nSecond line.\r\n".encode('utf-8') * 20)
+
+        processor = StreamingProcessor()
+        chunks = list(processor._read_mapped_chunks(input_path, chunk_size=7))
+
+        assert "".join(chunks) == input_path.read_text(encoding='utf-8')
+
+
 def test_streaming_with_deduplication():
     """Test streaming with deduplication enabled."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -191,5 +265,16 @@ def test_streaming_with_cache():
         assert cache_path.exists() or processor.deduplicator.hash_map  # Either persisted or in memory
 
 
+def test_streaming_processor_pickles():
+    """Test that a processor with classifier and deduplicator can be pickled."""
+    processor = StreamingProcessor(classify=True, deduplicate=True)
+
+    restored = pickle.loads(pickle.dumps(processor))
+
+    assert restored.classifier.classify("Plain prose sentence.").content_type == \
+        processor.classifier.classify("Plain prose sentence.").content_type
+    assert restored.deduplicator.is_duplicate("A sentence long enough to track") is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,11 +1,14 @@
 """Tests for validation utilities."""
 
+import os
+import re
 import pytest
-import tempfile
 from pathlib import Path
+from hydracontext.utils import validation
 from hydracontext.utils.validation import (
     ValidationError,
     validate_file_readable,
+    validate_files_readable,
     validate_file_writable,
     validate_text_encoding,
     validate_text_content,
@@ -15,53 +18,131 @@ from hydracontext.utils.validation import (
     validate_file_size,
 )
 
-
-def test_validate_file_readable_exists():
+# Error-message patterns, compiled once for all pytest.raises checks
+RE_EXPECTED_STRING = re.compile(r"Expected string")
+RE_ENCODING_ERROR = re.compile(r"File encoding error")
+RE_FILE_NOT_FOUND = re.compile(r"File not found")
+RE_FILE_TOO_LARGE = re.compile(r"File too large")
+RE_INVALID_ALGORITHM = re.compile(r"Invalid algorithm")
+RE_INVALID_GRANULARITY = re.compile(r"Invalid granularity")
+RE_NOT_A_FILE = re.compile(r"Not a file")
+RE_TOO_LONG = re.compile(r"Text too long")
+RE_TOO_SHORT = re.compile(r"Text too short")
+RE_NOT_A_NUMBER = re.compile(r"must be a number")
+RE_OUT_OF_RANGE = re.compile(r"must be between 0\.0 and 1\.0")
+
+
+def test_validate_file_readable_exists(tmp_files):
     """Test validating a readable file."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-        f.write("test content")
-        temp_path = Path(f.name)
-
-    try:
-        validate_file_readable(temp_path)  # Should not raise
-    finally:
-        temp_path.unlink()
+    validate_file_readable(tmp_files['small'])  # Should not raise
 
 
 def test_validate_file_readable_not_exists():
     """Test validating a non-existent file."""
     fake_path = Path("/this/does/not/exist.txt")
 
-    with pytest.raises(ValidationError, match="File not found"):
+    with pytest.raises(ValidationError, match=RE_FILE_NOT_FOUND):
         validate_file_readable(fake_path)
 
 
-def test_validate_file_writable():
+def test_validate_file_readable_cache_misses(tmp_path):
+    """Test that cached misses expire once the TTL has passed."""
+    path = tmp_path / "late.txt"
+
+    with pytest.raises(ValidationError, match=RE_FILE_NOT_FOUND):
+        validate_file_readable(path, cache_misses=True)
+
+    path.write_text("created after the first check")
+    with pytest.raises(ValidationError, match=RE_FILE_NOT_FOUND):
+        validate_file_readable(path, cache_misses=True)
+
+    validate_file_readable(path)  # Uncached checks always stat
+
+    validation._MISSING_PATHS[os.fspath(path)] -= validation._MISSING_PATH_TTL
+    validate_file_readable(path, cache_misses=True)  # Should not raise
+
+
+def test_validate_files_readable(tmp_files, tmp_path):
+    """Test batch validation returns stat results in input order."""
+    other = tmp_path / "other.txt"
+    other.write_text("in a second directory")
+    paths = [tmp_files['big'], other, tmp_files['small'], tmp_files['utf8']]
+    expected = [(os.stat(path).st_ino, os.stat(path).st_size) for path in paths]
+
+    results = validate_files_readable(paths)
+
+    assert [(result.st_ino, result.st_size) for result in results] == expected
+
+    with pytest.raises(ValidationError, match=RE_FILE_NOT_FOUND):
+        validate_files_readable([tmp_files['small'], tmp_path / "missing.txt"])
+
+    with pytest.raises(ValidationError, match=RE_NOT_A_FILE):
+        validate_files_readable([tmp_path])
+
+
+def test_validate_file_writable(tmp_path):
     """Test validating writable file path."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "output.txt"
-        validate_file_writable(output_path)  # Should not raise
+    output_path = tmp_path / "output.txt"
+    validate_file_writable(output_path)  # Should not raise
 
 
-def test_validate_file_writable_creates_dir():
+def test_validate_file_writable_creates_dir(tmp_path):
     """Test that validation creates parent directories."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "subdir" / "output.txt"
-        validate_file_writable(output_path)
+    output_path = tmp_path / "subdir" / "output.txt"
+    validate_file_writable(output_path)
 
-        assert output_path.parent.exists()
+    assert output_path.parent.exists()
 
 
-def test_validate_text_encoding_valid():
+def test_validate_text_encoding_valid(tmp_files):
     """Test validating file with correct encoding."""
-    with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as f:
-        f.write("Hello, World! 你好")
-        temp_path = Path(f.name)
+    validate_text_encoding(tmp_files['utf8'], encoding='utf-8')  # Should not raise
+
+
+def test_validate_text_encoding_split_character(tmp_path):
+    """Test that a character straddling the probe boundary is not an error."""
+    path = tmp_path / "split.txt"
+    path.write_text("A" * (64 * 1024 - 1) + "你好", encoding='utf-8')
+
+    validate_text_encoding(path, encoding='utf-8')  # Should not raise
 
-    try:
-        validate_text_encoding(temp_path, encoding='utf-8')  # Should not raise
-    finally:
-        temp_path.unlink()
+
+def test_validate_text_encoding_invalid(tmp_path):
+    """Test validating file that is not valid in the encoding."""
+    path = tmp_path / "invalid.txt"
+    path.write_bytes(b"\xff\xfe not utf-8")
+
+    with pytest.raises(ValidationError, match=RE_ENCODING_ERROR):
+        validate_text_encoding(path, encoding='utf-8')
+
+
+def test_validate_text_encoding_invalid_after_first_kb(tmp_path):
+    """Test that invalid bytes past the start of the file are rejected."""
+    path = tmp_path / "late_invalid.txt"
+    path.write_bytes(b"A" * 2000 + b"\xff\xfe")
+
+    with pytest.raises(ValidationError, match=RE_ENCODING_ERROR):
+        validate_text_encoding(path, encoding='utf-8')
+
+
+def test_validate_text_encoding_full_file(tmp_path):
+    """Test that only a full decode finds invalid bytes past the probe."""
+    path = tmp_path / "late_invalid.txt"
+    path.write_bytes(b"A" * (128 * 1024) + b"\xff\xfe")
+
+    validate_text_encoding(path, encoding='utf-8')  # Past the default probe
+
+    with pytest.raises(ValidationError, match=RE_ENCODING_ERROR):
+        validate_text_encoding(path, encoding='utf-8', max_bytes=None)
+
+
+def test_validate_text_encoding_truncated_character(tmp_path):
+    """Test that a multi-byte character cut off at end of file is rejected."""
+    path = tmp_path / "truncated.txt"
+    path.write_bytes("ok 你".encode('utf-8')[:-1])
+
+    with pytest.raises(ValidationError, match=RE_ENCODING_ERROR):
+        validate_text_encoding(path, encoding='utf-8')
 
 
 def test_validate_text_content_valid():
@@ -74,7 +155,7 @@ def test_validate_text_content_too_short():
     """Test validating text that's too short."""
     text = "Hi"
 
-    with pytest.raises(ValidationError, match="Text too short"):
+    with pytest.raises(ValidationError, match=RE_TOO_SHORT):
         validate_text_content(text, min_length=10)
 
 
@@ -82,87 +163,87 @@ def test_validate_text_content_too_long():
     """Test validating text that's too long."""
     text = "A" * 1000
 
-    with pytest.raises(ValidationError, match="Text too long"):
+    with pytest.raises(ValidationError, match=RE_TOO_LONG):
         validate_text_content(text, min_length=1, max_length=100)
 
 
 def test_validate_text_content_not_string():
     """Test validating non-string input."""
-    with pytest.raises(ValidationError, match="Expected string"):
+    with pytest.raises(ValidationError, match=RE_EXPECTED_STRING):
         validate_text_content(123)  # Not a string
 
 
-def test_validate_granularity_valid():
+@pytest.mark.parametrize("granularity", ['sentence', 'paragraph'])
+def test_validate_granularity_valid(granularity):
     """Test validating valid granularity values."""
-    validate_granularity('sentence')  # Should not raise
-    validate_granularity('paragraph')  # Should not raise
+    validate_granularity(granularity)  # Should not raise
 
 
 def test_validate_granularity_invalid():
     """Test validating invalid granularity."""
-    with pytest.raises(ValidationError, match="Invalid granularity"):
+    with pytest.raises(ValidationError, match=RE_INVALID_GRANULARITY):
         validate_granularity('word')
 
 
-def test_validate_hash_algorithm_valid():
+@pytest.mark.parametrize("algorithm", ['md5', 'sha256', 'blake2b'])
+def test_validate_hash_algorithm_valid(algorithm):
     """Test validating valid hash algorithms."""
-    validate_hash_algorithm('md5')  # Should not raise
-    validate_hash_algorithm('sha256')  # Should not raise
-    validate_hash_algorithm('blake2b')  # Should not raise
+    validate_hash_algorithm(algorithm)  # Should not raise
 
 
 def test_validate_hash_algorithm_invalid():
     """Test validating invalid hash algorithm."""
-    with pytest.raises(ValidationError, match="Invalid algorithm"):
+    with pytest.raises(ValidationError, match=RE_INVALID_ALGORITHM):
         validate_hash_algorithm('sha512')
 
 
-def test_validate_confidence_threshold_valid():
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 1.0])
+def test_validate_confidence_threshold_valid(threshold):
     """Test validating valid confidence thresholds."""
-    validate_confidence_threshold(0.0)  # Should not raise
-    validate_confidence_threshold(0.5)  # Should not raise
-    validate_confidence_threshold(1.0)  # Should not raise
+    validate_confidence_threshold(threshold)  # Should not raise
 
 
 def test_validate_confidence_threshold_out_of_range():
     """Test validating out-of-range threshold."""
-    with pytest.raises(ValidationError, match="must be between 0.0 and 1.0"):
+    with pytest.raises(ValidationError, match=RE_OUT_OF_RANGE):
         validate_confidence_threshold(1.5)
 
-    with pytest.raises(ValidationError, match="must be between 0.0 and 1.0"):
+    with pytest.raises(ValidationError, match=RE_OUT_OF_RANGE):
         validate_confidence_threshold(-0.1)
 
 
 def test_validate_confidence_threshold_not_number():
     """Test validating non-numeric threshold."""
-    with pytest.raises(ValidationError, match="must be a number"):
+    with pytest.raises(ValidationError, match=RE_NOT_A_NUMBER):
         validate_confidence_threshold("0.5")
 
 
-def test_validate_file_size():
+def test_validate_file_size(tmp_files):
     """Test validating file size."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-        f.write("A" * 1000)  # 1KB file
-        temp_path = Path(f.name)
+    size = validate_file_size(tmp_files['small'], max_size_mb=1)
+    assert size == 1000
+
+
+def test_validate_file_size_max_bytes(tmp_files):
+    """Test validating file size against a byte limit."""
+    assert validate_file_size(tmp_files['small'], max_bytes=1000) == 1000
+
+    with pytest.raises(ValidationError, match=RE_FILE_TOO_LARGE):
+        validate_file_size(tmp_files['small'], max_bytes=999)
+
+
+def test_validate_file_size_reuses_stat(tmp_files):
+    """Test passing the stat result from validate_file_readable."""
+    stat_result = validate_file_readable(tmp_files['big'])
 
-    try:
-        size = validate_file_size(temp_path, max_size_mb=1)
-        assert size == 1000
-    finally:
-        temp_path.unlink()
+    with pytest.raises(ValidationError, match=RE_FILE_TOO_LARGE):
+        validate_file_size(tmp_files['big'], max_size_mb=1, stat_result=stat_result)
 
 
-def test_validate_file_size_too_large():
+def test_validate_file_size_too_large(tmp_files):
     """Test validating oversized file."""
-    with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-        f.write("A" * (2 * 1024 * 1024))  # 2MB file
-        temp_path = Path(f.name)
-
-    try:
-        with pytest.raises(ValidationError, match="File too large"):
-            validate_file_size(temp_path, max_size_mb=1)
-    finally:
-        temp_path.unlink()
+    with pytest.raises(ValidationError, match=RE_FILE_TOO_LARGE):
+        validate_file_size(tmp_files['big'], max_size_mb=1)
 
 
 if __name__ == "__main__":